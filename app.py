@@ -4,6 +4,14 @@ import tempfile
 import zipfile
 import git
 import shutil
+import zlib
+import hashlib
+import html
+import re
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter, itemgetter
 from pathlib import Path
 import magic
 from typing import List, Dict, Optional
@@ -92,6 +100,29 @@ st.markdown("""
         background-color: #e9ecef;
         border-color: #1E88E5;
     }
+    .file-card {
+        background: white;
+        padding: 1rem;
+        border-radius: 10px;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+        margin-bottom: 1rem;
+        text-align: center;
+        cursor: pointer;
+        transition: all 0.3s;
+    }
+    .file-card-icon {
+        font-size: 2em;
+        margin-bottom: 0.5rem;
+    }
+    .file-card-name {
+        font-weight: bold;
+        margin-bottom: 0.5rem;
+        word-break: break-word;
+    }
+    .file-card-dir {
+        color: #666;
+        font-size: 0.8em;
+    }
     .metric-container {
         background-color: #f8f9fa;
         padding: 1rem;
@@ -139,6 +170,7 @@ config = {
     'max_function_length': 50,
     'max_complexity': 10,
     'min_comment_ratio': 0.1,
+    'max_view_file_bytes': 2 * 1024 * 1024,  # Larger files are not loaded into the viewer
     
     # Supported programming languages configuration
     # Each language includes:
@@ -189,6 +221,17 @@ config = {
     }
 }
 
+# Extensions accepted for upload, built once for membership tests
+SUPPORTED_EXTENSIONS = frozenset(
+    ext for lang in config['supported_languages'].values() for ext in lang['extensions']
+)
+
+# Number of files kept in the recent files list
+MAX_RECENT_FILES = 10
+
+# Number of file buttons rendered per directory (tree view) or page (list/grid view)
+FILE_PAGE_SIZE = 50
+
 # Initialize the stats manager
 if 'stats_manager' not in st.session_state:
     st.session_state.stats_manager = StatsManager()
@@ -628,12 +671,8 @@ def handle_file_upload(uploaded_file):
         try:
             # Validate file extension
             file_ext = Path(uploaded_file.name).suffix.lower()
-            supported_extensions = []
-            for lang in config['supported_languages'].values():
-                supported_extensions.extend(lang['extensions'])
-            
-            if file_ext not in supported_extensions:
-                st.error(f"Unsupported file type. Supported extensions: {', '.join(supported_extensions)}")
+            if file_ext not in SUPPORTED_EXTENSIONS:
+                st.error(f"Unsupported file type. Supported extensions: {', '.join(sorted(SUPPORTED_EXTENSIONS))}")
                 return False
             
             # Process and analyze file
@@ -650,6 +689,7 @@ def handle_file_upload(uploaded_file):
             # Update all session state variables
             st.session_state.current_file = str(file_path)
             st.session_state.current_code = content
+            st.session_state.current_code_hash = content_hash(content)
             
             # Update source code state
             if 'source_code' not in st.session_state:
@@ -673,15 +713,11 @@ def handle_file_upload(uploaded_file):
             }
             
             # Add to recent files
-            if 'recent_files' not in st.session_state:
-                st.session_state.recent_files = []
-            if str(file_path) not in st.session_state.recent_files:
-                st.session_state.recent_files.insert(0, str(file_path))
-                st.session_state.recent_files = st.session_state.recent_files[:10]
+            add_recent_file(str(file_path))
             
             # Analyze file
             try:
-                file_metrics = analyze_file(str(file_path), content)
+                file_metrics = classify_dependencies(analyze_file(str(file_path), content))
                 st.session_state.current_metrics = file_metrics
                 st.session_state.uploaded_files[str(file_path)].update(file_metrics)
                 st.session_state.files[str(file_path)].update(file_metrics)
@@ -732,35 +768,32 @@ def handle_zip_upload(uploaded_zip):
             st.session_state.uploaded_files = {}
             st.session_state.files = {}
             
-            # Get supported file extensions
-            supported_extensions = []
-            for lang in config['supported_languages'].values():
-                supported_extensions.extend(lang['extensions'])
-            
-            # Process all supported files
-            files_found = False
-            for root, _, files in os.walk(extract_dir):
-                for file in files:
-                    file_ext = Path(file).suffix.lower()
-                    if file_ext in supported_extensions:
-                        files_found = True
-                        file_path = Path(root) / file
-                        try:
-                            # Analyze individual file
-                            file_metrics = analyzer.analyze_file(str(file_path))
-                            st.session_state.uploaded_files[str(file_path)] = file_metrics
-                            st.session_state.files[str(file_path)] = file_metrics
-                            
-                            # Update statistics
-                            st.session_state.stats_manager.update_file_analysis(
-                                file,
-                                file_metrics
-                            )
-                        except Exception as e:
-                            st.warning(f"Error analyzing {file}: {str(e)}")
+            # Collect all supported files, then analyze them together so
+            # larger archives are spread over a process pool
+            file_paths = [
+                str(Path(root) / file)
+                for root, _, files in os.walk(extract_dir)
+                for file in files
+                if Path(file).suffix.lower() in SUPPORTED_EXTENSIONS
+            ]
+            files_found = bool(file_paths)
+            for file_path, file_metrics in zip(
+                    file_paths, analyzer.analyze_files(file_paths)):
+                file = os.path.basename(file_path)
+                try:
+                    st.session_state.uploaded_files[file_path] = file_metrics
+                    st.session_state.files[file_path] = file_metrics
+                    
+                    # Update statistics
+                    st.session_state.stats_manager.update_file_analysis(
+                        file,
+                        file_metrics
+                    )
+                except Exception as e:
+                    st.warning(f"Error analyzing {file}: {str(e)}")
             
             if not files_found:
-                st.warning(f"No supported files found in the ZIP archive. Supported extensions: {', '.join(supported_extensions)}")
+                st.warning(f"No supported files found in the ZIP archive. Supported extensions: {', '.join(sorted(SUPPORTED_EXTENSIONS))}")
                 return False
             
             # Set initial file selection
@@ -810,35 +843,32 @@ def handle_github_upload(repo_url):
         st.session_state.files = {}
         analyzer = CodeAnalyzer(config)
         
-        # Get supported file extensions
-        supported_extensions = []
-        for lang in config['supported_languages'].values():
-            supported_extensions.extend(lang['extensions'])
-        
-        # Process all supported files
-        files_found = False
-        for root, _, files in os.walk(repo_dir):
-            for file in files:
-                file_ext = Path(file).suffix.lower()
-                if file_ext in supported_extensions:
-                    files_found = True
-                    file_path = Path(root) / file
-                    try:
-                        # Analyze file
-                        file_metrics = analyzer.analyze_file(str(file_path))
-                        st.session_state.uploaded_files[str(file_path)] = file_metrics
-                        st.session_state.files[str(file_path)] = file_metrics
-                        
-                        # Update statistics
-                        st.session_state.stats_manager.update_file_analysis(
-                            file,
-                            file_metrics
-                        )
-                    except Exception as e:
-                        st.warning(f"Error analyzing {file}: {str(e)}")
+        # Collect all supported files, then analyze them together so
+        # larger repositories are spread over a process pool
+        file_paths = [
+            str(Path(root) / file)
+            for root, _, files in os.walk(repo_dir)
+            for file in files
+            if Path(file).suffix.lower() in SUPPORTED_EXTENSIONS
+        ]
+        files_found = bool(file_paths)
+        for file_path, file_metrics in zip(
+                file_paths, analyzer.analyze_files(file_paths)):
+            file = os.path.basename(file_path)
+            try:
+                st.session_state.uploaded_files[file_path] = file_metrics
+                st.session_state.files[file_path] = file_metrics
+                
+                # Update statistics
+                st.session_state.stats_manager.update_file_analysis(
+                    file,
+                    file_metrics
+                )
+            except Exception as e:
+                st.warning(f"Error analyzing {file}: {str(e)}")
         
         if not files_found:
-            st.warning(f"No supported files found in the repository. Supported extensions: {', '.join(supported_extensions)}")
+            st.warning(f"No supported files found in the repository. Supported extensions: {', '.join(sorted(SUPPORTED_EXTENSIONS))}")
             return False
         
         # Set initial file selection
@@ -1612,6 +1642,25 @@ def display_metrics_tab(metrics):
             )
             st.plotly_chart(fig_issues, use_container_width=True)
 
+# Extensions accepted by each file type filter; "all" has no entry and matches everything
+_TYPE_EXT_SET = {
+    "python": frozenset({".py"}),
+    "java": frozenset({".java"}),
+    "javascript": frozenset({".js", ".jsx", ".ts", ".tsx"}),
+    "html": frozenset({".html", ".htm"}),
+    "css": frozenset({".css"}),
+    "json": frozenset({".json"}),
+    "yaml": frozenset({".yaml", ".yml"}),
+    "markdown": frozenset({".md", ".markdown"}),
+    "text": frozenset({".txt", ".text"}),
+}
+
+def _update_active_ext_set():
+    """Resolve the selected file type filter to its extension set."""
+    file_type = st.session_state.file_type_filter_select
+    st.session_state.file_type_filter = file_type
+    st.session_state._active_ext_set = _TYPE_EXT_SET.get(file_type)
+
 def display_file_explorer():
     """Display the file explorer interface with enhanced features."""
     # Initialize session state variables if they don't exist
@@ -1637,10 +1686,13 @@ def display_file_explorer():
         st.session_state.sort_order = "asc"  # Options: asc, desc
     if 'file_type_filter' not in st.session_state:
         st.session_state.file_type_filter = "all"  # Options: all, python, java, javascript, etc.
+    if '_active_ext_set' not in st.session_state:
+        st.session_state._active_ext_set = _TYPE_EXT_SET.get(st.session_state.file_type_filter)
     if 'recent_files' not in st.session_state:
-        st.session_state.recent_files = []
+        st.session_state.recent_files = deque(maxlen=MAX_RECENT_FILES)
+        st.session_state.recent_set = set()
     if 'smells' not in st.session_state:
-        st.session_state.smells = []
+        _store_smells([])
 
     # Header with gradient background and search bar
     st.markdown("""
@@ -1676,12 +1728,14 @@ def display_file_explorer():
             )
             
             # File type filter
-            file_types = ["all", "python", "java", "javascript", "html", "css", "json", "yaml", "markdown", "text"]
+            file_types = ["all", *_TYPE_EXT_SET]
             st.session_state.file_type_filter = st.selectbox(
                 "File Type",
                 file_types,
                 index=file_types.index(st.session_state.file_type_filter),
-                help="Filter by file type"
+                help="Filter by file type",
+                key="file_type_filter_select",
+                on_change=_update_active_ext_set
             )
             
             # Sort options
@@ -1713,7 +1767,7 @@ def display_file_explorer():
         # Recent files section
         if st.session_state.recent_files:
             with st.expander("🕒 Recent Files", expanded=True):
-                for file_path in st.session_state.recent_files[:5]:
+                for file_path in islice(st.session_state.recent_files, 5):
                     if file_path in st.session_state.uploaded_files:
                         file_name = os.path.basename(file_path)
                         file_ext = os.path.splitext(file_name)[1].lower()
@@ -1738,13 +1792,28 @@ def display_file_explorer():
             </div>
         """, unsafe_allow_html=True)
         
-        # Group files by directory
+        # Group files by directory, collecting sort keys once per file.
+        # Sizes and modification times can change on disk, so they are
+        # re-read on every run while the list is sorted by one of them.
+        if 'file_meta' not in st.session_state:
+            st.session_state.file_meta = {}
+        if 'file_meta_version' not in st.session_state:
+            st.session_state.file_meta_version = 0
+        file_meta = st.session_state.file_meta
         files_by_dir = {}
         for file_path in st.session_state.uploaded_files.keys():
             dir_path = os.path.dirname(file_path)
             if dir_path not in files_by_dir:
                 files_by_dir[dir_path] = []
             files_by_dir[dir_path].append(file_path)
+        rescan = st.session_state.sort_by in ("size", "modified")
+        meta_changed = False
+        for dir_path, files in files_by_dir.items():
+            stale = files if rescan else [file_path for file_path in files if file_path not in file_meta]
+            if stale and scan_file_meta(dir_path, stale, file_meta):
+                meta_changed = True
+        if meta_changed:
+            st.session_state.file_meta_version += 1
         
         # Display files based on selected view mode
         if st.session_state.view_mode == "tree":
@@ -2292,235 +2361,7 @@ def display_file_explorer():
                         </div>
                     """, unsafe_allow_html=True)
                     
-                    # Chart type selector
-                    chart_type = st.selectbox(
-                        "Select Visualization Type",
-                        ["Code Composition", "Quality Metrics", "Time Series", "Dependencies", "Custom Analysis"],
-                        key="chart_type_selector"
-                    )
-                    
-                    if chart_type == "Code Composition":
-                        # Interactive pie chart for code composition
-                        raw_metrics = st.session_state.current_metrics.get('raw_metrics', {})
-                        comments = raw_metrics.get('comments', 0) + raw_metrics.get('multi', 0)
-                        
-                        composition_data = {
-                            'Category': ['Source Lines', 'Comments', 'Blank Lines', 'Classes', 'Functions', 'Methods'],
-                            'Count': [
-                                raw_metrics.get('sloc', 0),
-                                comments,
-                                raw_metrics.get('blank', 0),
-                                raw_metrics.get('classes', 0),
-                                raw_metrics.get('functions', 0),
-                                raw_metrics.get('methods', 0)
-                            ]
-                        }
-                        df_composition = pd.DataFrame(composition_data)
-                        
-                        # Add interactivity options
-                        chart_style = st.radio(
-                            "Chart Style",
-                            ["Pie", "Bar", "Treemap"],
-                            horizontal=True
-                        )
-                        
-                        if chart_style == "Pie":
-                            fig = px.pie(
-                                df_composition,
-                                values='Count',
-                                names='Category',
-                                title='Code Composition Analysis',
-                                color_discrete_sequence=px.colors.qualitative.Set3
-                            )
-                        elif chart_style == "Bar":
-                            fig = px.bar(
-                                df_composition,
-                                x='Category',
-                                y='Count',
-                                title='Code Composition Analysis',
-                                color='Category',
-                                color_discrete_sequence=px.colors.qualitative.Set3
-                            )
-                        else:  # Treemap
-                            fig = px.treemap(
-                                df_composition,
-                                path=['Category'],
-                                values='Count',
-                                title='Code Composition Analysis',
-                                color='Count',
-                                color_continuous_scale='RdBu'
-                            )
-                        
-                        st.plotly_chart(fig, use_container_width=True)
-                        
-                        # Add interactive data table
-                        st.dataframe(
-                            df_composition,
-                            column_config={
-                                "Category": "Metric",
-                                "Count": st.column_config.NumberColumn(
-                                    "Value",
-                                    help="Number of occurrences",
-                                    format="%d"
-                                )
-                            },
-                            hide_index=True
-                        )
-                    
-                    elif chart_type == "Quality Metrics":
-                        # Quality metrics visualization
-                        maintainability = st.session_state.current_metrics.get('maintainability', {}).get('score', 0)
-                        complexity = st.session_state.current_metrics.get('complexity', {}).get('score', 0)
-                        
-                        # Add metric selection
-                        selected_metrics = st.multiselect(
-                            "Select Metrics to Display",
-                            ["Maintainability", "Complexity", "Comment Ratio"],
-                            default=["Maintainability", "Complexity"]
-                        )
-                        
-                        # Create radar chart data
-                        metrics_data = {
-                            'Metric': selected_metrics,
-                            'Score': [
-                                maintainability if "Maintainability" in selected_metrics else None,
-                                complexity if "Complexity" in selected_metrics else None,
-                                float(raw_metrics.get('comments', 0)) / raw_metrics.get('loc', 1) * 100 if "Comment Ratio" in selected_metrics else None
-                            ]
-                        }
-                        metrics_df = pd.DataFrame(metrics_data)
-                        metrics_df = metrics_df.dropna()
-                        
-                        # Create radar chart
-                        fig = go.Figure()
-                        fig.add_trace(go.Scatterpolar(
-                            r=metrics_df['Score'],
-                            theta=metrics_df['Metric'],
-                            fill='toself',
-                            name='Current File'
-                        ))
-                        
-                        fig.update_layout(
-                            polar=dict(
-                                radialaxis=dict(
-                                    visible=True,
-                                    range=[0, 100]
-                                )
-                            ),
-                            showlegend=False
-                        )
-                        
-                        st.plotly_chart(fig, use_container_width=True)
-                    
-                    elif chart_type == "Dependencies":
-                        # Dependencies visualization
-                        if st.session_state.current_metrics.get('dependencies'):
-                            direct_deps = []
-                            indirect_deps = []
-                            for dep in st.session_state.current_metrics['dependencies']:
-                                if 'direct' in dep.lower():
-                                    direct_deps.append(dep)
-                                else:
-                                    indirect_deps.append(dep)
-                            
-                            # Create Sankey diagram
-                            labels = ['Current File'] + direct_deps + indirect_deps
-                            source = ([0] * len(direct_deps) +
-                                    list(range(1, len(direct_deps) + 1)) * (len(indirect_deps) // len(direct_deps)))
-                            target = (list(range(1, len(direct_deps) + 1)) +
-                                    list(range(len(direct_deps) + 1, len(labels))))
-                            value = [1] * len(source)
-                            
-                            fig = go.Figure(data=[go.Sankey(
-                                node=dict(
-                                    pad=15,
-                                    thickness=20,
-                                    line=dict(color="black", width=0.5),
-                                    label=labels,
-                                    color="blue"
-                                ),
-                                link=dict(
-                                    source=source,
-                                    target=target,
-                                    value=value
-                                )
-                            )])
-                            
-                            fig.update_layout(title_text="Dependency Flow", font_size=10)
-                            st.plotly_chart(fig, use_container_width=True)
-                        else:
-                            st.info("No dependencies data available for visualization")
-                    
-                    elif chart_type == "Time Series":
-                        # Time series analysis of code changes
-                        dates = pd.date_range(end=pd.Timestamp.now(), periods=10, freq='D')
-                        metrics = ['Complexity', 'Maintainability', 'Lines of Code']
-                        
-                        # Create sample time series data
-                        time_series_data = {
-                            'Date': dates,
-                            'Complexity': np.random.normal(complexity, 5, 10),
-                            'Maintainability': np.random.normal(maintainability, 5, 10),
-                            'Lines of Code': np.random.normal(raw_metrics.get('loc', 100), 10, 10)
-                        }
-                        df_time = pd.DataFrame(time_series_data)
-                        
-                        # Add metric selector
-                        selected_metric = st.selectbox(
-                            "Select Metric to Track",
-                            metrics
-                        )
-                        
-                        # Create line chart
-                        fig = px.line(
-                            df_time,
-                            x='Date',
-                            y=selected_metric,
-                            title=f'{selected_metric} Over Time',
-                            markers=True
-                        )
-                        
-                        st.plotly_chart(fig, use_container_width=True)
-                    
-                    elif chart_type == "Custom Analysis":
-                        # Custom analysis options
-                        st.markdown("### Create Your Own Analysis")
-                        
-                        # Get available metrics
-                        available_metrics = {
-                            'Lines of Code': raw_metrics.get('loc', 0),
-                            'Comments': comments,
-                            'Functions': raw_metrics.get('functions', 0),
-                            'Classes': raw_metrics.get('classes', 0),
-                            'Methods': raw_metrics.get('methods', 0),
-                            'Complexity': complexity,
-                            'Maintainability': maintainability
-                        }
-                        
-                        # Let user select metrics to compare
-                        x_axis = st.selectbox("Select X-Axis Metric", list(available_metrics.keys()))
-                        y_axis = st.selectbox("Select Y-Axis Metric", list(available_metrics.keys()))
-                        
-                        # Create scatter plot
-                        custom_data = {
-                            'x': [available_metrics[x_axis]],
-                            'y': [available_metrics[y_axis]]
-                        }
-                        
-                        fig = px.scatter(
-                            custom_data,
-                            x='x',
-                            y='y',
-                            title=f'{y_axis} vs {x_axis}',
-                            labels={'x': x_axis, 'y': y_axis}
-                        )
-                        
-                        st.plotly_chart(fig, use_container_width=True)
-                        
-                        # Add correlation analysis
-                        if st.checkbox("Show Correlation Analysis"):
-                            correlation = np.corrcoef([available_metrics[x_axis]], [available_metrics[y_axis]])[0, 1]
-                            st.metric("Correlation Coefficient", f"{correlation:.2f}")
+                    _render_interactive_charts()
                 else:
                     st.info("Please select a file to view interactive charts.")
             
@@ -2532,135 +2373,7 @@ def display_file_explorer():
                         </div>
                     """, unsafe_allow_html=True)
                     
-                    # Analyze the current file for smells
-                    if st.button("Analyze Code Smells", type="primary", use_container_width=True, key="analyze_smells_btn"):
-                        with st.spinner("Analyzing code smells..."):
-                            try:
-                                smells = st.session_state.smell_analyzer.analyze_file(
-                                    st.session_state.current_file,
-                                    st.session_state.current_code
-                                )
-                                st.session_state.smells = smells
-                                
-                                if not smells:
-                                    st.success("No code smells detected in this file!")
-                            except Exception as e:
-                                st.error(f"Error analyzing code smells: {str(e)}")
-                                st.session_state.smells = []
-                    
-                    if st.session_state.smells:
-                        # Display smell statistics
-                        stats = st.session_state.smell_analyzer.get_smell_statistics(st.session_state.smells)
-                        
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric("Total Smells", stats['total_smells'])
-                        with col2:
-                            st.metric("Code Smells", stats['by_type'].get('code_smells', 0))
-                        with col3:
-                            st.metric("Design Smells", stats['by_type'].get('design_smells', 0))
-                        
-                        # Create tabs for different smell types
-                        smell_type_tabs = st.tabs(["Code Smells", "Design Smells", "Architectural Smells"])
-                        
-                        with smell_type_tabs[0]:
-                            code_smells = [s for s in st.session_state.smells if s.type == SmellType.CODE_SMELL]
-                            if code_smells:
-                                for smell in code_smells:
-                                    with st.expander(f"🔴 {smell.name} - {smell.severity.value}", expanded=True):
-                                        st.markdown(f"**Location:** {smell.location}")
-                                        st.markdown(f"**Description:** {smell.description}")
-                                        if smell.metrics:
-                                            st.markdown("**Metrics:**")
-                                            for metric, value in smell.metrics.items():
-                                                st.markdown(f"- {metric}: {value}")
-                                        if smell.recommendations:
-                                            st.markdown("**Recommendations:**")
-                                            for rec in smell.recommendations:
-                                                st.markdown(f"- {rec}")
-                            else:
-                                st.success("No code smells detected!")
-                        
-                        with smell_type_tabs[1]:
-                            design_smells = [s for s in st.session_state.smells if s.type == SmellType.DESIGN_SMELL]
-                            if design_smells:
-                                for smell in design_smells:
-                                    with st.expander(f"🔴 {smell.name} - {smell.severity.value}", expanded=True):
-                                        st.markdown(f"**Location:** {smell.location}")
-                                        st.markdown(f"**Description:** {smell.description}")
-                                        if smell.metrics:
-                                            st.markdown("**Metrics:**")
-                                            for metric, value in smell.metrics.items():
-                                                st.markdown(f"- {metric}: {value}")
-                                        if smell.recommendations:
-                                            st.markdown("**Recommendations:**")
-                                            for rec in smell.recommendations:
-                                                st.markdown(f"- {rec}")
-                            else:
-                                st.success("No design smells detected!")
-                        
-                        with smell_type_tabs[2]:
-                            arch_smells = [s for s in st.session_state.smells if s.type == SmellType.ARCHITECTURAL_SMELL]
-                            if arch_smells:
-                                for smell in arch_smells:
-                                    with st.expander(f"🔴 {smell.name} - {smell.severity.value}", expanded=True):
-                                        st.markdown(f"**Location:** {smell.location}")
-                                        st.markdown(f"**Description:** {smell.description}")
-                                        if smell.metrics:
-                                            st.markdown("**Metrics:**")
-                                            for metric, value in smell.metrics.items():
-                                                st.markdown(f"- {metric}: {value}")
-                                        if smell.recommendations:
-                                            st.markdown("**Recommendations:**")
-                                            for rec in smell.recommendations:
-                                                st.markdown(f"- {rec}")
-                            else:
-                                st.success("No architectural smells detected!")
-                        
-                        if len(st.session_state.smells) > 0:
-                            # Add visualization of smell distribution
-                            st.markdown("### Smell Distribution")
-                            smell_data = {
-                                'Type': ['Code Smells', 'Design Smells', 'Architectural Smells'],
-                                'Count': [
-                                    stats['by_type'].get('code_smells', 0),
-                                    stats['by_type'].get('design_smells', 0),
-                                    stats['by_type'].get('architectural_smells', 0)
-                                ]
-                            }
-                            df_smells = pd.DataFrame(smell_data)
-                            
-                            fig = px.pie(
-                                df_smells,
-                                values='Count',
-                                names='Type',
-                                title='Distribution of Smells by Type',
-                                color_discrete_sequence=px.colors.qualitative.Set3
-                            )
-                            st.plotly_chart(fig, use_container_width=True)
-                            
-                            # Add severity distribution
-                            st.markdown("### Severity Distribution")
-                            severity_data = {
-                                'Severity': ['Low', 'Medium', 'High', 'Critical'],
-                                'Count': [
-                                    stats['by_severity'].get('low', 0),
-                                    stats['by_severity'].get('medium', 0),
-                                    stats['by_severity'].get('high', 0),
-                                    stats['by_severity'].get('critical', 0)
-                                ]
-                            }
-                            df_severity = pd.DataFrame(severity_data)
-                            
-                            fig = px.bar(
-                                df_severity,
-                                x='Severity',
-                                y='Count',
-                                title='Distribution of Smells by Severity',
-                                color='Severity',
-                                color_discrete_sequence=['#4CAF50', '#FFC107', '#FF5722', '#F44336']
-                            )
-                            st.plotly_chart(fig, use_container_width=True)
+                    _render_smells_tab()
                 else:
                     st.info("Please select a file to analyze code smells.")
         else:
@@ -2680,6 +2393,477 @@ def display_file_explorer():
                 </div>
             """, unsafe_allow_html=True)
 
+# Hover style for the file buttons, emitted once per view render
+_BUTTON_CSS = """
+    <style>
+    div[data-testid="stButton"] button {
+        background-color: transparent;
+        border: 1px solid #e0e0e0;
+        transition: all 0.3s;
+    }
+    div[data-testid="stButton"] button:hover {
+        background-color: #f0f2f6;
+        border-color: #1E88E5;
+    }
+    </style>
+"""
+
+def content_hash(content):
+    """Return a short digest identifying the given file content."""
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+
+@st.cache_data(show_spinner=False)
+def _cached_analyze_smells(file_path, code_hash, _content, _analyzer):
+    """Run smell analysis once per (path, content hash) pair."""
+    return _analyzer.analyze_file(file_path, _content)
+
+_SMELL_TYPES = [SmellType.CODE_SMELL, SmellType.DESIGN_SMELL, SmellType.ARCHITECTURAL_SMELL]
+
+def _store_smells(smells):
+    """Store smells with their statistics and per-type buckets in session state."""
+    smells_by_type = {smell_type: [] for smell_type in _SMELL_TYPES}
+    for smell in smells:
+        smells_by_type[smell.type].append(smell)
+    st.session_state.smells = smells
+    st.session_state.smells_by_type = smells_by_type
+    st.session_state.smell_stats = st.session_state.smell_analyzer.get_smell_statistics(smells)
+
+def _chart_key(name):
+    """Build a plotly_chart key that stays stable while the current file is unchanged."""
+    code_hash = st.session_state.get('current_code_hash') or b''
+    return f"{name}_{code_hash.hex()}"
+
+@st.cache_data(show_spinner=False)
+def _composition_figure(counts, chart_style):
+    """Build the code composition chart for the given counts and style."""
+    df_composition = pd.DataFrame({
+        'Category': ['Source Lines', 'Comments', 'Blank Lines', 'Classes', 'Functions', 'Methods'],
+        'Count': list(counts)
+    })
+    if chart_style == "Pie":
+        return px.pie(
+            df_composition,
+            values='Count',
+            names='Category',
+            title='Code Composition Analysis',
+            color_discrete_sequence=px.colors.qualitative.Set3
+        )
+    if chart_style == "Bar":
+        return px.bar(
+            df_composition,
+            x='Category',
+            y='Count',
+            title='Code Composition Analysis',
+            color='Category',
+            color_discrete_sequence=px.colors.qualitative.Set3
+        )
+    return px.treemap(
+        df_composition,
+        path=['Category'],
+        values='Count',
+        title='Code Composition Analysis',
+        color='Count',
+        color_continuous_scale='RdBu'
+    )
+
+@st.cache_data(show_spinner=False)
+def _radar_figure(metric_scores):
+    """Build the quality metrics radar chart from (metric, score) pairs."""
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(
+        r=[score for _, score in metric_scores],
+        theta=[metric for metric, _ in metric_scores],
+        fill='toself',
+        name='Current File'
+    ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100]
+            )
+        ),
+        showlegend=False
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _dependency_figure(direct_deps, indirect_deps):
+    """Build the dependency flow Sankey diagram."""
+    labels = ['Current File'] + list(direct_deps) + list(indirect_deps)
+    n_direct, n_indirect = len(direct_deps), len(indirect_deps)
+    
+    # Current file links to every direct dependency; indirect dependencies are
+    # spread round-robin across the direct ones (or hang off the file if there are none)
+    if n_direct:
+        indirect_source = np.arange(n_indirect) % n_direct + 1
+    else:
+        indirect_source = np.zeros(n_indirect, dtype=int)
+    source = np.concatenate([np.zeros(n_direct, dtype=int), indirect_source])
+    target = np.arange(1, len(labels))
+    value = np.ones(source.size, dtype=int)
+    
+    fig = go.Figure(data=[go.Sankey(
+        node=dict(
+            pad=15,
+            thickness=20,
+            line=dict(color="black", width=0.5),
+            label=labels,
+            color="blue"
+        ),
+        link=dict(
+            source=source,
+            target=target,
+            value=value
+        )
+    )])
+    
+    fig.update_layout(title_text="Dependency Flow", font_size=10)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _time_series_figure(file_path, base_values, selected_metric, end_date):
+    """Build the sample time series chart for a file's metrics."""
+    dates = pd.date_range(end=end_date, periods=10, freq='D')
+    metrics = ['Complexity', 'Maintainability', 'Lines of Code']
+    
+    # Create sample time series data in a single draw, seeded per file
+    # so the sample stays stable across reruns
+    rng = np.random.default_rng(zlib.crc32(file_path.encode('utf-8')))
+    samples = rng.normal(
+        loc=list(base_values),
+        scale=[5, 5, 10],
+        size=(10, 3)
+    )
+    time_series_data = {'Date': dates}
+    time_series_data.update(zip(metrics, samples.T))
+    df_time = pd.DataFrame(time_series_data)
+    
+    return px.line(
+        df_time,
+        x='Date',
+        y=selected_metric,
+        title=f'{selected_metric} Over Time',
+        markers=True,
+        render_mode='webgl'
+    )
+
+@st.cache_data(show_spinner=False)
+def _smell_type_figure(counts):
+    """Build the smell distribution pie chart from per-type counts."""
+    fig = go.Figure(data=[go.Pie(
+        labels=['Code Smells', 'Design Smells', 'Architectural Smells'],
+        values=list(counts),
+        marker=dict(colors=px.colors.qualitative.Set3)
+    )])
+    fig.update_layout(title_text='Distribution of Smells by Type')
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _smell_severity_figure(counts):
+    """Build the smell severity bar chart from per-severity counts."""
+    fig = go.Figure(data=[go.Bar(
+        x=['Low', 'Medium', 'High', 'Critical'],
+        y=list(counts),
+        marker=dict(color=['#4CAF50', '#FFC107', '#FF5722', '#F44336'])
+    )])
+    fig.update_layout(
+        title_text='Distribution of Smells by Severity',
+        xaxis_title='Severity',
+        yaxis_title='Count'
+    )
+    return fig
+
+@st.fragment
+def _render_interactive_charts():
+    """Render the interactive charts tab; reruns on its own when a chart option changes."""
+    raw_metrics = st.session_state.current_metrics.get('raw_metrics', {})
+    comments = raw_metrics.get('comments', 0) + raw_metrics.get('multi', 0)
+    maintainability = st.session_state.current_metrics.get('maintainability', {}).get('score', 0)
+    complexity = st.session_state.current_metrics.get('complexity', {}).get('score', 0)
+    
+    # Chart type selector
+    chart_type = st.selectbox(
+        "Select Visualization Type",
+        ["Code Composition", "Quality Metrics", "Time Series", "Dependencies", "Custom Analysis"],
+        key="chart_type_selector"
+    )
+    
+    if chart_type == "Code Composition":
+        # Interactive pie chart for code composition
+        composition_data = {
+            'Category': ['Source Lines', 'Comments', 'Blank Lines', 'Classes', 'Functions', 'Methods'],
+            'Count': [
+                raw_metrics.get('sloc', 0),
+                comments,
+                raw_metrics.get('blank', 0),
+                raw_metrics.get('classes', 0),
+                raw_metrics.get('functions', 0),
+                raw_metrics.get('methods', 0)
+            ]
+        }
+        df_composition = pd.DataFrame(composition_data)
+        
+        # Add interactivity options
+        chart_style = st.radio(
+            "Chart Style",
+            ["Pie", "Bar", "Treemap"],
+            horizontal=True
+        )
+        
+        fig = _composition_figure(tuple(composition_data['Count']), chart_style)
+        st.plotly_chart(fig, use_container_width=True, key=_chart_key("composition"))
+        
+        # Add interactive data table
+        st.dataframe(
+            df_composition,
+            column_config={
+                "Category": "Metric",
+                "Count": st.column_config.NumberColumn(
+                    "Value",
+                    help="Number of occurrences",
+                    format="%d"
+                )
+            },
+            hide_index=True
+        )
+    
+    elif chart_type == "Quality Metrics":
+        # Quality metrics visualization
+        # Add metric selection
+        selected_metrics = st.multiselect(
+            "Select Metrics to Display",
+            ["Maintainability", "Complexity", "Comment Ratio"],
+            default=["Maintainability", "Complexity"]
+        )
+        
+        # Create radar chart data
+        available_scores = {
+            "Maintainability": maintainability,
+            "Complexity": complexity
+        }
+        if "Comment Ratio" in selected_metrics:
+            # loc is 0 for empty files and for files that failed to parse
+            available_scores["Comment Ratio"] = (
+                float(raw_metrics.get('comments', 0)) / (raw_metrics.get('loc') or 1) * 100
+            )
+        metric_scores = tuple((metric, available_scores[metric]) for metric in selected_metrics)
+        
+        fig = _radar_figure(metric_scores)
+        st.plotly_chart(fig, use_container_width=True, key=_chart_key("radar"))
+    
+    elif chart_type == "Dependencies":
+        # Dependencies visualization
+        metrics = st.session_state.current_metrics
+        if metrics.get('dependencies'):
+            if 'direct_deps' not in metrics:
+                classify_dependencies(metrics)
+            
+            fig = _dependency_figure(tuple(metrics['direct_deps']), tuple(metrics['indirect_deps']))
+            st.plotly_chart(fig, use_container_width=True, key=_chart_key("dependencies"))
+        else:
+            st.info("No dependencies data available for visualization")
+    
+    elif chart_type == "Time Series":
+        # Time series analysis of code changes
+        metrics = ['Complexity', 'Maintainability', 'Lines of Code']
+        
+        # Add metric selector
+        selected_metric = st.selectbox(
+            "Select Metric to Track",
+            metrics
+        )
+        
+        fig = _time_series_figure(
+            st.session_state.current_file,
+            (complexity, maintainability, raw_metrics.get('loc', 100)),
+            selected_metric,
+            pd.Timestamp.now().normalize()
+        )
+        st.plotly_chart(fig, use_container_width=True, key=_chart_key("time_series"))
+    
+    elif chart_type == "Custom Analysis":
+        # Custom analysis options
+        st.markdown("### Create Your Own Analysis")
+        
+        # Get available metrics
+        available_metrics = {
+            'Lines of Code': raw_metrics.get('loc', 0),
+            'Comments': comments,
+            'Functions': raw_metrics.get('functions', 0),
+            'Classes': raw_metrics.get('classes', 0),
+            'Methods': raw_metrics.get('methods', 0),
+            'Complexity': complexity,
+            'Maintainability': maintainability
+        }
+        
+        # Let user select metrics to compare
+        x_axis = st.selectbox("Select X-Axis Metric", list(available_metrics.keys()))
+        y_axis = st.selectbox("Select Y-Axis Metric", list(available_metrics.keys()))
+        
+        # The current file gives one value per metric, too few for a scatter
+        # plot or a correlation, so compare the two selected metrics side by side
+        fig = go.Figure(data=[go.Bar(
+            x=[x_axis, y_axis],
+            y=[available_metrics[x_axis], available_metrics[y_axis]],
+            marker=dict(color=px.colors.qualitative.Set3[:2])
+        )])
+        fig.update_layout(title_text=f'{y_axis} vs {x_axis}')
+        st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def _render_smells_tab():
+    """Render the code smells tab; reruns on its own when its widgets change."""
+    # Analyze the current file for smells
+    if st.button("Analyze Code Smells", type="primary", use_container_width=True, key="analyze_smells_btn"):
+        with st.spinner("Analyzing code smells..."):
+            try:
+                code_hash = st.session_state.get('current_code_hash')
+                if code_hash is None:
+                    code_hash = content_hash(st.session_state.current_code)
+                    st.session_state.current_code_hash = code_hash
+                smells = _cached_analyze_smells(
+                    st.session_state.current_file,
+                    code_hash,
+                    st.session_state.current_code,
+                    st.session_state.smell_analyzer
+                )
+                _store_smells(smells)
+                
+                if not smells:
+                    st.success("No code smells detected in this file!")
+            except Exception as e:
+                st.error(f"Error analyzing code smells: {str(e)}")
+                _store_smells([])
+    
+    if st.session_state.smells:
+        # Display smell statistics
+        stats = st.session_state.smell_stats
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Total Smells", stats['total_smells'])
+        with col2:
+            st.metric("Code Smells", stats['by_type'].get('code_smells', 0))
+        with col3:
+            st.metric("Design Smells", stats['by_type'].get('design_smells', 0))
+        
+        # Create tabs for different smell types
+        smell_type_tabs = st.tabs(["Code Smells", "Design Smells", "Architectural Smells"])
+        
+        empty_messages = [
+            "No code smells detected!",
+            "No design smells detected!",
+            "No architectural smells detected!"
+        ]
+        for tab, smell_type, empty_msg in zip(smell_type_tabs, _SMELL_TYPES, empty_messages):
+            with tab:
+                _render_smells(st.session_state.smells_by_type[smell_type], empty_msg)
+        
+        if len(st.session_state.smells) > 0:
+            # Add visualization of smell distribution
+            st.markdown("### Smell Distribution")
+            smell_counts = [
+                stats['by_type'].get('code_smells', 0),
+                stats['by_type'].get('design_smells', 0),
+                stats['by_type'].get('architectural_smells', 0)
+            ]
+            
+            fig = _smell_type_figure(tuple(smell_counts))
+            st.plotly_chart(fig, use_container_width=True, key=_chart_key("smell_types"))
+            
+            # Add severity distribution
+            st.markdown("### Severity Distribution")
+            severity_counts = [
+                stats['by_severity'].get('low', 0),
+                stats['by_severity'].get('medium', 0),
+                stats['by_severity'].get('high', 0),
+                stats['by_severity'].get('critical', 0)
+            ]
+            
+            fig = _smell_severity_figure(tuple(severity_counts))
+            st.plotly_chart(fig, use_container_width=True, key=_chart_key("smell_severity"))
+
+def _render_smells(smells, empty_msg):
+    """Render a list of smells as one HTML block, or a success message if empty."""
+    if not smells:
+        st.success(empty_msg)
+        return
+    parts = []
+    for smell in smells:
+        parts.append(
+            f"<details open><summary>🔴 {html.escape(smell.name)} - {html.escape(smell.severity.value)}</summary>"
+            f"<p><strong>Location:</strong> {html.escape(str(smell.location))}</p>"
+            f"<p><strong>Description:</strong> {html.escape(smell.description)}</p>"
+        )
+        if smell.metrics:
+            items = "".join(
+                f"<li>{html.escape(str(metric))}: {html.escape(str(value))}</li>"
+                for metric, value in smell.metrics.items()
+            )
+            parts.append(f"<p><strong>Metrics:</strong></p><ul>{items}</ul>")
+        if smell.recommendations:
+            items = "".join(f"<li>{html.escape(rec)}</li>" for rec in smell.recommendations)
+            parts.append(f"<p><strong>Recommendations:</strong></p><ul>{items}</ul>")
+        parts.append("</details>")
+    st.markdown("".join(parts), unsafe_allow_html=True)
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def _cached_analyze_file(file_path, mtime, size, _analyzer):
+    """Run static analysis once per (path, mtime, size) so re-selecting a file is instant."""
+    return classify_dependencies(_analyzer.analyze_file(file_path))
+
+def classify_dependencies(metrics):
+    """Split metrics['dependencies'] into direct_deps and indirect_deps lists."""
+    direct_deps = []
+    indirect_deps = []
+    for dep in metrics.get('dependencies') or []:
+        if 'direct' in dep.casefold():
+            direct_deps.append(dep)
+        else:
+            indirect_deps.append(dep)
+    metrics['direct_deps'] = direct_deps
+    metrics['indirect_deps'] = indirect_deps
+    return metrics
+
+# Position of each sort criterion within a file_meta tuple
+SORT_IDX = {"name": 0, "size": 1, "modified": 2, "type": 3}
+
+_stat_sort_fields = attrgetter('st_size', 'st_mtime')
+
+def _file_meta(file_name, file_stat):
+    """Return the (name_lower, size, mtime, ext) sort keys for a file."""
+    size, mtime = _stat_sort_fields(file_stat) if file_stat else (0, 0.0)
+    return (file_name.lower(), size, mtime, os.path.splitext(file_name)[1].lower())
+
+def scan_file_meta(dir_path, file_paths, file_meta):
+    """Fill file_meta for files in one directory using a single os.scandir pass.
+    
+    DirEntry caches its stat result, so each file costs at most one stat call;
+    files that cannot be found or stat-ed sort as empty. Returns whether any
+    entry of file_meta was added or changed.
+    """
+    wanted = {os.path.basename(file_path): file_path for file_path in file_paths}
+    old_meta = {file_path: file_meta.get(file_path) for file_path in file_paths}
+    try:
+        with os.scandir(dir_path or '.') as entries:
+            for entry in entries:
+                file_path = wanted.pop(entry.name, None)
+                if file_path is None:
+                    continue
+                try:
+                    file_stat = entry.stat()
+                except OSError:
+                    file_stat = None
+                file_meta[file_path] = _file_meta(entry.name, file_stat)
+    except OSError:
+        pass
+    for file_name, file_path in wanted.items():
+        file_meta[file_path] = _file_meta(file_name, None)
+    return any(file_meta[file_path] != meta for file_path, meta in old_meta.items())
+
+@lru_cache(maxsize=64)
 def get_file_icon(file_ext):
     """Get appropriate icon based on file extension."""
     icon = "📄"
@@ -2711,16 +2895,44 @@ def get_file_icon(file_ext):
         icon = "📱"
     return icon
 
+def add_recent_file(file_path):
+    """Move a file to the front of the recent files, keeping the most recent ones."""
+    recent = st.session_state.get('recent_files')
+    if not isinstance(recent, deque):
+        recent = deque(recent or [], maxlen=MAX_RECENT_FILES)
+        st.session_state.recent_files = recent
+        st.session_state.recent_set = set(recent)
+    recent_set = st.session_state.recent_set
+    
+    if file_path in recent_set:
+        recent.remove(file_path)
+    elif len(recent) == recent.maxlen:
+        # appendleft will evict the oldest entry
+        recent_set.discard(recent[-1])
+    recent.appendleft(file_path)
+    recent_set.add(file_path)
+
 def select_file(file_path):
     """Select a file and update session state."""
     try:
-        # Read file content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Skip files too large to display
+        file_stat = os.stat(file_path)
+        
+        max_bytes = config['max_view_file_bytes']
+        if file_stat.st_size > max_bytes:
+            st.warning(
+                f"{os.path.basename(file_path)} is {file_stat.st_size / 1024 / 1024:.1f} MB, "
+                f"larger than the {max_bytes / 1024 / 1024:.0f} MB viewer limit."
+            )
+            return False
+        
+        # Read file content in one call; undecodable bytes are replaced rather than failing
+        content = Path(file_path).read_bytes().decode('utf-8', errors='replace')
             
         # Update all session state variables
         st.session_state.current_file = file_path
         st.session_state.current_code = content
+        st.session_state.current_code_hash = content_hash(content)
         
         # Update source code state
         if 'source_code' not in st.session_state:
@@ -2744,20 +2956,17 @@ def select_file(file_path):
         st.session_state.files[file_path]['code'] = content
         
         # Add to recent files
-        if 'recent_files' not in st.session_state:
-            st.session_state.recent_files = []
-        if file_path not in st.session_state.recent_files:
-            st.session_state.recent_files.insert(0, file_path)
-            st.session_state.recent_files = st.session_state.recent_files[:10]  # Keep only 10 most recent
-        else:
-            # Move to top if already exists
-            st.session_state.recent_files.remove(file_path)
-            st.session_state.recent_files.insert(0, file_path)
+        add_recent_file(file_path)
             
         # Analyze file if analyzer exists
         if 'analyzer' in st.session_state:
             try:
-                metrics = st.session_state.analyzer.analyze_file(file_path)
+                metrics = _cached_analyze_file(
+                    file_path,
+                    file_stat.st_mtime,
+                    file_stat.st_size,
+                    st.session_state.analyzer
+                )
                 st.session_state.current_metrics = metrics
                 st.session_state.uploaded_files[file_path].update(metrics)
                 st.session_state.files[file_path].update(metrics)
@@ -2769,66 +2978,105 @@ def select_file(file_path):
         return False
     return True
 
-def display_tree_view(files_by_dir):
-    """Display files in tree view."""
-    # Filter files based on search term and file type
-    filtered_files_by_dir = {}
+def load_more_button(page_key, total):
+    """Show a 'Load more' button when only part of a file list is displayed."""
+    shown = st.session_state.get(page_key, FILE_PAGE_SIZE)
+    if total > shown:
+        if st.button(
+            f"Load more ({total - shown} remaining)",
+            key=f"load_more_{page_key}",
+            use_container_width=True
+        ):
+            st.session_state[page_key] = shown + FILE_PAGE_SIZE
+            st.rerun()
+
+def _file_list_key():
+    """Return the inputs that determine the filtered and sorted file lists."""
+    return (
+        st.session_state.file_filter,
+        st.session_state.file_type_filter,
+        st.session_state.sort_by,
+        st.session_state.sort_order,
+        hash(tuple(st.session_state.uploaded_files)),
+        st.session_state.file_meta_version,
+    )
+
+def _memoized_file_list(kind, build, files_by_dir):
+    """Return build(files_by_dir), reusing the last result while the filter and sort inputs are unchanged."""
+    key = _file_list_key()
+    cache = st.session_state.setdefault('file_list_cache', {})
+    cached = cache.get(kind)
+    if cached is None or cached[0] != key:
+        cached = (key, build(files_by_dir))
+        cache[kind] = cached
+    return cached[1]
+
+def _build_tree_file_list(files_by_dir):
+    """Filter and sort files within each directory, returning [(dir_path, [(file_path, file_ext)])] by directory."""
+    # Name and extension come from the precomputed file_meta, so neither the
+    # filter nor the sort has to call basename/splitext
+    file_meta = st.session_state.file_meta
+    sort_idx = SORT_IDX[st.session_state.sort_by]
+    descending = st.session_state.sort_order == "desc"
+    active_ext_set = st.session_state._active_ext_set
+    name_filter = st.session_state.file_filter.lower()
+    tree = []
+    for dir_path in sorted(files_by_dir.keys()):
+        decorated = []
+        for file_path in files_by_dir[dir_path]:
+            meta = file_meta[file_path]
+            
+            # Apply filters
+            if name_filter and name_filter not in meta[0]:
+                continue
+                
+            if active_ext_set is not None and meta[3] not in active_ext_set:
+                continue
+            
+            decorated.append((meta[sort_idx], file_path, meta[3]))
+        
+        if not decorated:
+            continue
+        
+        # Sort files based on selected criteria and order
+        decorated.sort(key=itemgetter(0), reverse=descending)
+        tree.append((dir_path, [(file_path, file_ext) for _, file_path, file_ext in decorated]))
+    return tree
+
+def _build_flat_file_list(files_by_dir):
+    """Filter and sort all files across directories, returning [(dir_path, file_path, file_ext)]."""
+    file_meta = st.session_state.file_meta
+    sort_idx = SORT_IDX[st.session_state.sort_by]
+    descending = st.session_state.sort_order == "desc"
+    active_ext_set = st.session_state._active_ext_set
+    name_filter = st.session_state.file_filter.lower()
+    decorated = []
     for dir_path, files in files_by_dir.items():
-        filtered_files = []
         for file_path in files:
-            file_name = os.path.basename(file_path)
-            file_ext = os.path.splitext(file_name)[1].lower()
+            meta = file_meta[file_path]
             
             # Apply filters
-            if st.session_state.file_filter and st.session_state.file_filter.lower() not in file_name.lower():
+            if name_filter and name_filter not in meta[0]:
                 continue
                 
-            if st.session_state.file_type_filter != "all":
-                if st.session_state.file_type_filter == "python" and file_ext != ".py":
-                    continue
-                elif st.session_state.file_type_filter == "java" and file_ext != ".java":
-                    continue
-                elif st.session_state.file_type_filter == "javascript" and file_ext not in [".js", ".jsx", ".ts", ".tsx"]:
-                    continue
-                elif st.session_state.file_type_filter == "html" and file_ext not in [".html", ".htm"]:
-                    continue
-                elif st.session_state.file_type_filter == "css" and file_ext != ".css":
-                    continue
-                elif st.session_state.file_type_filter == "json" and file_ext != ".json":
-                    continue
-                elif st.session_state.file_type_filter == "yaml" and file_ext not in [".yaml", ".yml"]:
-                    continue
-                elif st.session_state.file_type_filter == "markdown" and file_ext not in [".md", ".markdown"]:
-                    continue
-                elif st.session_state.file_type_filter == "text" and file_ext not in [".txt", ".text"]:
-                    continue
+            if active_ext_set is not None and meta[3] not in active_ext_set:
+                continue
             
-            filtered_files.append(file_path)
-        
-        if filtered_files:
-            filtered_files_by_dir[dir_path] = filtered_files
+            decorated.append((meta[sort_idx], dir_path, file_path, meta[3]))
     
-    # Sort directories
-    sorted_dirs = sorted(filtered_files_by_dir.keys())
+    # Sort files based on selected criteria and order
+    decorated.sort(key=itemgetter(0), reverse=descending)
+    return [entry[1:] for entry in decorated]
+
+def display_tree_view(files_by_dir):
+    """Display files in tree view."""
+    tree = _memoized_file_list("tree", _build_tree_file_list, files_by_dir)
+    
+    # Button hover style is shared by every file button in the view
+    st.markdown(_BUTTON_CSS, unsafe_allow_html=True)
     
     # Display files grouped by directory with filtering
-    for dir_path in sorted_dirs:
-        files = filtered_files_by_dir[dir_path]
-        
-        # Sort files based on selected criteria
-        if st.session_state.sort_by == "name":
-            files.sort(key=lambda x: os.path.basename(x).lower())
-        elif st.session_state.sort_by == "size":
-            files.sort(key=lambda x: os.path.getsize(x))
-        elif st.session_state.sort_by == "modified":
-            files.sort(key=lambda x: os.path.getmtime(x))
-        elif st.session_state.sort_by == "type":
-            files.sort(key=lambda x: os.path.splitext(x)[1].lower())
-        
-        # Apply sort order
-        if st.session_state.sort_order == "desc":
-            files.reverse()
-        
+    for dir_path, files in tree:
         dir_name = os.path.basename(dir_path) if dir_path else "Root"
         is_expanded = dir_path in st.session_state.expanded_dirs
         
@@ -2836,29 +3084,13 @@ def display_tree_view(files_by_dir):
             if not is_expanded:
                 st.session_state.expanded_dirs.add(dir_path)
             
-            for file_path in files:
+            page_key = f"page_{dir_path}"
+            for file_path, file_ext in files[:st.session_state.get(page_key, FILE_PAGE_SIZE)]:
                 file_name = os.path.basename(file_path)
-                file_ext = os.path.splitext(file_name)[1].lower()
                 
                 # Get appropriate icon based on file extension
                 icon = get_file_icon(file_ext)
                 
-                # Create a button with hover effect
-                button_style = """
-                    <style>
-                    div[data-testid="stButton"] button {
-                        background-color: transparent;
-                        border: 1px solid #e0e0e0;
-                        transition: all 0.3s;
-                    }
-                    div[data-testid="stButton"] button:hover {
-                        background-color: #f0f2f6;
-                        border-color: #1E88E5;
-                    }
-                    </style>
-                """
-                st.markdown(button_style, unsafe_allow_html=True)
-                
                 if st.button(
                     f"{icon} {file_name}",
                     key=f"file_{file_path}",
@@ -2866,203 +3098,115 @@ def display_tree_view(files_by_dir):
                     use_container_width=True
                 ):
                     select_file(file_path)
+            
+            load_more_button(page_key, len(files))
 
 def display_list_view(files_by_dir):
     """Display files in list view."""
-    # Flatten the directory structure for list view
-    all_files = []
-    for dir_path, files in files_by_dir.items():
-        for file_path in files:
-            all_files.append((dir_path, file_path))
-    
-    # Filter files based on search term and file type
-    filtered_files = []
-    for dir_path, file_path in all_files:
-        file_name = os.path.basename(file_path)
-        file_ext = os.path.splitext(file_name)[1].lower()
-        
-        # Apply filters
-        if st.session_state.file_filter and st.session_state.file_filter.lower() not in file_name.lower():
-            continue
-            
-        if st.session_state.file_type_filter != "all":
-            if st.session_state.file_type_filter == "python" and file_ext != ".py":
-                continue
-            elif st.session_state.file_type_filter == "java" and file_ext != ".java":
-                continue
-            elif st.session_state.file_type_filter == "javascript" and file_ext not in [".js", ".jsx", ".ts", ".tsx"]:
-                continue
-            elif st.session_state.file_type_filter == "html" and file_ext not in [".html", ".htm"]:
-                continue
-            elif st.session_state.file_type_filter == "css" and file_ext != ".css":
-                continue
-            elif st.session_state.file_type_filter == "json" and file_ext != ".json":
-                continue
-            elif st.session_state.file_type_filter == "yaml" and file_ext not in [".yaml", ".yml"]:
-                continue
-            elif st.session_state.file_type_filter == "markdown" and file_ext not in [".md", ".markdown"]:
-                continue
-            elif st.session_state.file_type_filter == "text" and file_ext not in [".txt", ".text"]:
-                continue
-        
-        filtered_files.append((dir_path, file_path))
-    
-    # Sort files based on selected criteria
-    if st.session_state.sort_by == "name":
-        filtered_files.sort(key=lambda x: os.path.basename(x[1]).lower())
-    elif st.session_state.sort_by == "size":
-        filtered_files.sort(key=lambda x: os.path.getsize(x[1]))
-    elif st.session_state.sort_by == "modified":
-        filtered_files.sort(key=lambda x: os.path.getmtime(x[1]))
-    elif st.session_state.sort_by == "type":
-        filtered_files.sort(key=lambda x: os.path.splitext(x[1])[1].lower())
-    
-    # Apply sort order
-    if st.session_state.sort_order == "desc":
-        filtered_files.reverse()
+    filtered_files = _memoized_file_list("flat", _build_flat_file_list, files_by_dir)
     
     # Display files in list view
-    for dir_path, file_path in filtered_files:
+    visible_files = filtered_files[:st.session_state.get("page_list", FILE_PAGE_SIZE)]
+    dir_names = {
+        dir_path: os.path.basename(dir_path) if dir_path else "Root"
+        for dir_path in {dir_path for dir_path, _, _ in visible_files}
+    }
+    st.markdown(_BUTTON_CSS, unsafe_allow_html=True)
+    for dir_path, file_path, file_ext in visible_files:
         file_name = os.path.basename(file_path)
-        file_ext = os.path.splitext(file_name)[1].lower()
         
         # Get appropriate icon based on file extension
         icon = get_file_icon(file_ext)
         
-        # Create a button with hover effect
-        button_style = """
-            <style>
-            div[data-testid="stButton"] button {
-                background-color: transparent;
-                border: 1px solid #e0e0e0;
-                transition: all 0.3s;
-            }
-            div[data-testid="stButton"] button:hover {
-                background-color: #f0f2f6;
-                border-color: #1E88E5;
-            }
-            </style>
-        """
-        st.markdown(button_style, unsafe_allow_html=True)
-        
         # Display file path and name
-        dir_name = os.path.basename(dir_path) if dir_path else "Root"
         if st.button(
-            f"{icon} {dir_name}/{file_name}",
+            f"{icon} {dir_names[dir_path]}/{file_name}",
             key=f"file_{file_path}",
             help=f"Click to view {file_name}",
             use_container_width=True
         ):
             select_file(file_path)
+    
+    load_more_button("page_list", len(filtered_files))
+
+# Grid view card markup; styles come from the .file-card rules in the global CSS
+_CARD_TMPL = (
+    '<div class="file-card">'
+    '<div class="file-card-icon">{icon}</div>'
+    '<div class="file-card-name">{name}</div>'
+    '<div class="file-card-dir">{dir_display}</div>'
+    '</div>'
+).format
+
+def _open_selected_grid_file():
+    """Open the file chosen in the grid view selector."""
+    file_path = st.session_state.file_open_select
+    if file_path:
+        select_file(file_path)
 
 def display_grid_view(files_by_dir):
     """Display files in grid view."""
-    # Flatten the directory structure for grid view
-    all_files = []
-    for dir_path, files in files_by_dir.items():
-        for file_path in files:
-            all_files.append((dir_path, file_path))
+    filtered_files = _memoized_file_list("flat", _build_flat_file_list, files_by_dir)
     
-    # Filter files based on search term and file type
-    filtered_files = []
-    for dir_path, file_path in all_files:
-        file_name = os.path.basename(file_path)
-        file_ext = os.path.splitext(file_name)[1].lower()
-        
-        # Apply filters
-        if st.session_state.file_filter and st.session_state.file_filter.lower() not in file_name.lower():
-            continue
-            
-        if st.session_state.file_type_filter != "all":
-            if st.session_state.file_type_filter == "python" and file_ext != ".py":
-                continue
-            elif st.session_state.file_type_filter == "java" and file_ext != ".java":
-                continue
-            elif st.session_state.file_type_filter == "javascript" and file_ext not in [".js", ".jsx", ".ts", ".tsx"]:
-                continue
-            elif st.session_state.file_type_filter == "html" and file_ext not in [".html", ".htm"]:
-                continue
-            elif st.session_state.file_type_filter == "css" and file_ext != ".css":
-                continue
-            elif st.session_state.file_type_filter == "json" and file_ext != ".json":
-                continue
-            elif st.session_state.file_type_filter == "yaml" and file_ext not in [".yaml", ".yml"]:
-                continue
-            elif st.session_state.file_type_filter == "markdown" and file_ext not in [".md", ".markdown"]:
-                continue
-            elif st.session_state.file_type_filter == "text" and file_ext not in [".txt", ".text"]:
-                continue
-        
-        filtered_files.append((dir_path, file_path))
-    
-    # Sort files based on selected criteria
-    if st.session_state.sort_by == "name":
-        filtered_files.sort(key=lambda x: os.path.basename(x[1]).lower())
-    elif st.session_state.sort_by == "size":
-        filtered_files.sort(key=lambda x: os.path.getsize(x[1]))
-    elif st.session_state.sort_by == "modified":
-        filtered_files.sort(key=lambda x: os.path.getmtime(x[1]))
-    elif st.session_state.sort_by == "type":
-        filtered_files.sort(key=lambda x: os.path.splitext(x[1])[1].lower())
-    
-    # Apply sort order
-    if st.session_state.sort_order == "desc":
-        filtered_files.reverse()
-    
-    # Display files in grid view
+    # Display files in grid view, one card block per column
+    visible_files = filtered_files[:st.session_state.get("page_grid", FILE_PAGE_SIZE)]
+    icons = {
+        ext: get_file_icon(ext)
+        for ext in {file_ext for _, _, file_ext in visible_files}
+    }
+    dir_display = {
+        dir_path: html.escape(os.path.basename(dir_path) if dir_path else "Root")
+        for dir_path in {dir_path for dir_path, _, _ in visible_files}
+    }
     cols = st.columns(3)
-    for i, (dir_path, file_path) in enumerate(filtered_files):
-        file_name = os.path.basename(file_path)
-        file_ext = os.path.splitext(file_name)[1].lower()
+    for c, col in enumerate(cols):
+        column_files = visible_files[c::3]
+        if not column_files:
+            continue
         
-        # Get appropriate icon based on file extension
-        icon = get_file_icon(file_ext)
+        html_parts = []
+        for dir_path, file_path, file_ext in column_files:
+            file_name = os.path.basename(file_path)
+            html_parts.append(_CARD_TMPL(
+                icon=icons[file_ext],
+                name=html.escape(file_name),
+                dir_display=dir_display[dir_path]
+            ))
         
-        # Create a card for each file
-        with cols[i % 3]:
-            st.markdown(f"""
-                <div style="
-                    background: white;
-                    padding: 1rem;
-                    border-radius: 10px;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-                    margin-bottom: 1rem;
-                    text-align: center;
-                    cursor: pointer;
-                    transition: all 0.3s;
-                ">
-                    <div style="font-size: 2em; margin-bottom: 0.5rem;">
-                        {icon}
-                    </div>
-                    <div style="font-weight: bold; margin-bottom: 0.5rem; word-break: break-word;">
-                        {file_name}
-                    </div>
-                    <div style="color: #666; font-size: 0.8em;">
-                        {os.path.basename(dir_path) if dir_path else "Root"}
-                    </div>
-                </div>
-            """, unsafe_allow_html=True)
-            
-            if st.button(
-                "View File",
-                key=f"file_{file_path}",
-                help=f"Click to view {file_name}",
-                use_container_width=True
-            ):
-                select_file(file_path)
+        with col:
+            st.markdown("".join(html_parts), unsafe_allow_html=True)
+    
+    load_more_button("page_grid", len(filtered_files))
+    
+    # A single selector opens files instead of one button widget per card
+    st.selectbox(
+        "Open file",
+        options=[file_path for _, file_path, _ in filtered_files],
+        format_func=os.path.basename,
+        index=None,
+        placeholder="Choose a file to view...",
+        key="file_open_select",
+        on_change=_open_selected_grid_file
+    )
+
+@lru_cache(maxsize=32)
+def _search_term_pattern(term):
+    """Compile the pattern and highlight markup for an HTML-escaped search term."""
+    escaped_term = html.escape(term, quote=False)
+    replacement = f'<span style="background-color: yellow; font-weight: bold;">{escaped_term}</span>'
+    return re.compile(re.escape(escaped_term)), replacement
 
 def highlight_search_term(code, term):
     """Highlight search term in code."""
     if not term:
         return code
     
-    # Escape HTML special characters
-    code = code.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    # Escape HTML special characters in a single pass
+    code = html.escape(code, quote=False)
     
     # Highlight the search term
-    highlighted_code = code.replace(term, f'<span style="background-color: yellow; font-weight: bold;">{term}</span>')
-    
-    return highlighted_code
+    pattern, replacement = _search_term_pattern(term)
+    return pattern.sub(lambda _: replacement, code)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -3,31 +3,624 @@ import re
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 import magic
-import pygments
-from pygments.lexers import get_lexer_by_name
-from pygments.formatters import HtmlFormatter
-import radon.complexity as radon_complexity
 import radon.metrics as radon_metrics
 from radon.visitors import ComplexityVisitor
 import javalang
 import cpp_parser
-import esprima
 import csharp_parser
 import os
+import hashlib
+import pickle
 from radon.complexity import cc_visit
-from radon.metrics import h_visit
+from radon.metrics import h_visit_ast, mi_compute
 from radon.raw import analyze
 import math
-import tokenize
-from io import StringIO
-from datetime import datetime
+import copy
+import functools
+import time
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter, defaultdict, deque
+from types import MappingProxyType
+from itertools import chain
+from dataclasses import dataclass
+
+# File types included in project-wide analysis
+PROJECT_EXTENSIONS = ('.py', '.java')
+
+# Vendored, generated and tooling directories left out of project analysis
+SKIP_DIRS = frozenset({
+    '.git', 'node_modules', '.venv', 'venv', 'build', 'dist', '__pycache__'
+})
+
+# Default size limit for files included in project analysis
+DEFAULT_MAX_FILE_BYTES = 512 * 1024
+
+# Below this many files the process pool costs more than it saves
+PARALLEL_MIN_FILES = 4
+
+# Maximum number of file results kept by CodeAnalyzer.analyze_file
+FILE_CACHE_SIZE = 4096
+
+# Analysis results kept by content hash, and the time an
+# analysis must take before its result is worth keeping
+ANALYSIS_CACHE_SIZE = 128
+ANALYSIS_CACHE_MIN_SECONDS = 0.005
+
+# Version of the pickled Java parse summaries. The summaries hold computed
+# scores, so bump this whenever the Java complexity or smell logic changes
+# and entries written by older code stop matching.
+JAVA_CACHE_VERSION = 3
+
+# Default location of the on-disk Java parse cache, in the user's cache
+# directory rather than wherever the process happens to be started
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache'),
+    'coderefactorai')
+
+# Limits on the on-disk Java parse cache: entries kept before the oldest
+# are removed, and the largest file that is ever unpickled
+JAVA_CACHE_MAX_ENTRIES = 4096
+JAVA_CACHE_MAX_ENTRY_BYTES = 1024 * 1024
+
+# Keys every cached Java parse summary must have
+_JAVA_SUMMARY_KEYS = frozenset({
+    'classes', 'methods', 'imports', 'package_name', 'complexity',
+    'code_smells'
+})
+
+# Largest source whose radon scores are memoized; the memo keys on the
+# source text itself, so bigger inputs are always recomputed
+RADON_CACHE_MAX_CHARS = 256 * 1024
+
+
+# Java node types that add to complexity, with their weights
+_JAVA_CONTROL_WEIGHTS = {
+    javalang.tree.IfStatement: 1,
+    javalang.tree.ForStatement: 1,
+    javalang.tree.WhileStatement: 1,
+    javalang.tree.DoStatement: 1,
+    javalang.tree.CatchClause: 1,
+    javalang.tree.SwitchStatement: 1,
+    # Add weight for binary operations
+    javalang.tree.BinaryOperation: 0.5
+}
+
+# Java statements that open a new nesting level
+_JAVA_BRANCH_TYPES = frozenset({
+    javalang.tree.IfStatement,
+    javalang.tree.ForStatement,
+    javalang.tree.WhileStatement,
+    javalang.tree.DoStatement
+})
+
+# Python statements counted by the AST complexity estimate; node types
+# are checked by exact type, since none of these classes are subclassed
+_PY_CONTROL_TYPES = frozenset({
+    ast.If,
+    ast.While,
+    ast.For,
+    ast.AsyncFor,
+    ast.Try,
+    ast.With,
+    ast.AsyncWith
+})
+
+# Python statements that open a new nesting level
+_PY_BRANCH_TYPES = frozenset({ast.If, ast.For, ast.While})
+
+
+def _java_children(node):
+    """Yield the direct child nodes of a javalang node, flattening lists."""
+    pending = list(reversed(node.children))
+    while pending:
+        child = pending.pop()
+        if isinstance(child, javalang.ast.Node):
+            yield child
+        elif isinstance(child, (list, tuple)):
+            pending.extend(reversed(child))
+
+
+def _java_walk(tree):
+    """Yield every node of a javalang tree depth first, as tree.filter does."""
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(list(_java_children(node))))
+
+
+def _walk_python_statements(tree: ast.AST):
+    """Yield the statements of a Python AST in ast.walk order.
+
+    Statements only ever nest inside other statements, except handlers
+    and match cases, so expression subtrees (most of the tree) are never
+    entered.
+    """
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case)):
+                todo.append(child)
+        if isinstance(node, ast.stmt):
+            yield node
+
+
+def _is_range_len_call(node: ast.AST) -> bool:
+    """Whether node is a call of the form range(len(...))."""
+    return (isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == 'range'
+            and bool(node.args)
+            and isinstance(node.args[0], ast.Call)
+            and isinstance(node.args[0].func, ast.Name)
+            and node.args[0].func.id == 'len')
+
+
+def _python_nesting_depths(tree: ast.AST) -> Dict[int, int]:
+    """Map id(node) to the If/For/While nesting depth below every node.
+
+    Nodes are collected parents first with an explicit stack, so walking
+    them backwards visits every child before its parent and each depth
+    is computed exactly once.
+    """
+    nodes = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(ast.iter_child_nodes(node))
+
+    depths = {}
+    for node in reversed(nodes):
+        depth = 0
+        for child in ast.iter_child_nodes(node):
+            if type(child) in _PY_BRANCH_TYPES:
+                depth = max(depth, depths[id(child)] + 1)
+        depths[id(node)] = depth
+    return depths
+
+
+def _count_lines(content: str) -> int:
+    """Count lines like len(content.splitlines()) without building the list.
+
+    Source read from disk has its newlines normalized by _decode_source,
+    so counting "\n" is enough.
+    """
+    if not content:
+        return 0
+    return content.count('\n') + (not content.endswith('\n'))
+
+
+@functools.lru_cache(maxsize=64)
+def _memo_total_complexity(content: str) -> int:
+    """Memoized computation behind _radon_total_complexity."""
+    return sum(item.complexity for item in cc_visit(content))
+
+
+@functools.lru_cache(maxsize=64)
+def _memo_maintainability_index(content: str) -> float:
+    """Memoized computation behind _radon_maintainability_index."""
+    return radon_metrics.mi_visit(content, multi=True)
+
+
+def _radon_total_complexity(content: str) -> int:
+    """Summed radon cyclomatic complexity of every block in the source."""
+    if len(content) > RADON_CACHE_MAX_CHARS:
+        return _memo_total_complexity.__wrapped__(content)
+    return _memo_total_complexity(content)
+
+
+def _radon_maintainability_index(content: str) -> float:
+    """radon's maintainability index for the source, counting docstrings."""
+    if len(content) > RADON_CACHE_MAX_CHARS:
+        return _memo_maintainability_index.__wrapped__(content)
+    return _memo_maintainability_index(content)
+
+
+@functools.lru_cache(maxsize=32)
+def _pygments_lexer(language: str):
+    """Pygments lexer for a language; registry lookups are slow, so reuse it."""
+    from pygments.lexers import get_lexer_by_name
+    return get_lexer_by_name(language)
+
+
+@functools.lru_cache(maxsize=1)
+def _pygments_formatter():
+    """Shared monokai HTML formatter; resolving the style is not free."""
+    from pygments.formatters import HtmlFormatter
+    return HtmlFormatter(style='monokai')
+
+
+def _halstead_from_counts(n1: int, n2: int, N1: int, N2: int) -> Dict[str, float]:
+    """Derive the rounded Halstead measures from operator/operand counts.
+
+    n1 and n2 are the unique operators and operands, N1 and N2 their
+    totals. Zero counts are treated as one to prevent division by zero.
+    """
+    n1 = n1 or 1
+    n2 = n2 or 1
+    N1 = N1 or 1
+    N2 = N2 or 1
+
+    vocabulary = n1 + n2
+    length = N1 + N2
+    volume = length * math.log2(vocabulary)
+    difficulty = (n1 / 2) * (N2 / n2)
+    effort = difficulty * volume
+
+    return {
+        'vocabulary': round(vocabulary, 2),
+        'length': round(length, 2),
+        'volume': round(volume, 2),
+        'difficulty': round(difficulty, 2),
+        'effort': round(effort, 2),
+        'time': round(effort / 18, 2),  # Estimated time in seconds
+        'bugs': round(volume / 3000, 3)  # Estimated number of bugs
+    }
+
+
+def _halstead_token_counts(code: str) -> tuple:
+    """Count Halstead operators and operands by splitting source on whitespace.
+
+    This is the fallback for source that is not Python. Returns the
+    unique operator, unique operand, total operator and total operand
+    counts, in the order _halstead_from_counts takes them.
+    """
+    # Join the non-comment lines and split them into tokens with one call,
+    # then count them all at once; Counter and the set operations below do
+    # the per-token work in C
+    code_lines = [
+        line for line in map(str.lstrip, code.splitlines())
+        if line and not line.startswith(_HALSTEAD_COMMENT_PREFIXES)]
+    token_counts = Counter(' '.join(code_lines).split())
+    operators = _HALSTEAD_OPERATORS.intersection(token_counts)
+    total_operators = sum(token_counts[op] for op in operators)
+    return (len(operators), len(token_counts) - len(operators),
+            total_operators, token_counts.total() - total_operators)
+
+
+def _decode_source(data: bytes) -> str:
+    """Decode file bytes as UTF-8 text with universal newlines, like open()."""
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+# Classifies each Java source line in one regex sweep. Block comments
+# starting a line consume every line up to their closing "*/".
+_JAVA_LINE_TOK = re.compile(r"""
+    ^(?=[\s\S])[^\S\n]*(?:
+        (?P<blank>)$
+      | (?P<jdoc>/\*\*(?!/)[\s\S]*?(?:\*/|(?=\n?\Z)))[^\n]*
+      | (?P<block>/\*[\s\S]*?(?:\*/|(?=\n?\Z)))[^\n]*
+      | (?P<scom>//)[^\n]*
+      | (?P<star>\*)[^\n]*
+      | (?P<code>[^\n]*)
+    )\n?""", re.MULTILINE | re.VERBOSE)
+
+# Access modifier followed by a space, anywhere in the line
+_MODIFIER_RE = re.compile(r'(?:public|private|protected) ')
+
+# Keywords marking a type (not method) declaration
+_TYPE_DECL_RE = re.compile(r'class|interface|enum')
+
+
+# Line patterns used by the regex-based Java fallback analysis. They run
+# over all code lines joined by newlines, match at most once per line and
+# never cross a line break, so each match stands for one matching line.
+_JAVA_CLASS_RE = re.compile(
+    r'^[^\n]*?\b(?:public|private|protected)?[^\S\n]+class[^\S\n]+\w+',
+    re.MULTILINE)
+_JAVA_METHOD_RE = re.compile(
+    r'^[^\n]*?\b(?:public|private|protected)?[^\S\n]+\w+[^\S\n]+\w+'
+    r'[^\S\n]*\([^)\n]*\)',
+    re.MULTILINE)
+# Matches every import line; group 1 is the first import path on it
+_JAVA_IMPORT_RE = re.compile(
+    r'^(?=import )(?:[^\n]*?import[^\S\n]+([\w.]+);)?', re.MULTILINE)
+
+# Java keywords counted by the fallback complexity estimate, as one
+# alternation so the source is scanned once
+_JAVA_CONTROL_RE = re.compile(r'\b(?:if|while|for|switch|catch|case)\b')
+
+# Control structures and operators counted for C-style source text. They
+# are two patterns because an operator inside a condition, as in
+# "if (a && b)", counts separately from the statement itself.
+_C_STYLE_CONTROL_RES = (
+    re.compile(r'(?:if|for|while|switch|catch)\s*\([^)]*\)|else\s*{'),
+    re.compile(r'&&|\|\||[?:]')
+)
+
+
+# Substrings checked by the performance heuristics, one alternation per
+# language so each check is a single scan. None of the alternatives can
+# overlap, so the set of matches is exactly the set of substrings present.
+_PY_PERF_RE = re.compile(r'import \*|while True:|\.copy\(\)|list\(|dict\(')
+_CSHARP_PERF_RE = re.compile(r'virtual|sealed|object|var')
+_CPP_PERF_RE = re.compile(r'virtual|inline|const&')
+
+# Basic operators in most programming languages, used by the Halstead
+# fallback tokenizer for source that is not Python
+_HALSTEAD_OPERATORS = frozenset({
+    '+', '-', '*', '/', '%', '=', '==', '!=', '<', '>', '<=', '>=',
+    '&&', '||', '!', '++', '--', '+=', '-=', '*=', '/=', '%=',
+    'and', 'or', 'not', 'in', 'is', 'lambda', 'if', 'else', 'elif',
+    'for', 'while', 'return', 'yield', 'break', 'continue', 'pass'
+})
+
+# Line prefixes the Halstead fallback treats as comments; "*" also covers
+# "*/", so a line is rejected after at most four prefix compares
+_HALSTEAD_COMMENT_PREFIXES = ('#', '//', '/*', '*')
+
+# Languages of the file extensions that fall through to _analyze_generic.
+# They are not Python, so their Halstead metrics come straight from the
+# token fallback; other extensions still try parsing as Python first.
+_GENERIC_LANGUAGES = {
+    '.c': 'c',
+    '.cs': 'csharp',
+    '.go': 'go',
+    '.kt': 'kotlin',
+    '.php': 'php',
+    '.rb': 'ruby',
+    '.rs': 'rust',
+    '.scala': 'scala',
+    '.swift': 'swift'
+}
+
+# Halstead metrics reported for empty or unanalyzable code; read-only,
+# so callers get a copy from _get_default_halstead_metrics
+_DEFAULT_HALSTEAD_METRICS = MappingProxyType({
+    'vocabulary': 0,
+    'length': 0,
+    'volume': 0,
+    'difficulty': 0,
+    'effort': 0,
+    'time': 0,
+    'bugs': 0
+})
+
+
+@dataclass(slots=True)
+class _JavaLineStats:
+    """Line counts produced by _scan_java_lines."""
+    blank: int = 0
+    single: int = 0
+    multi: int = 0  # Block comment lines, including stray "*" lines
+    javadoc: int = 0
+    code: int = 0
+
+
+def _scan_java_lines(content: str,
+                     code_lines: Optional[List[str]] = None) -> _JavaLineStats:
+    """Classify every line of Java source as blank, comment or code.
+
+    This is the one comment scanner shared by all the Java analyses. The
+    character scanning happens inside the regex engine; Python only sees
+    one match per line (or per block comment). When code_lines is given,
+    the stripped text of each code line is appended to it.
+    """
+    stats = _JavaLineStats()
+    for match in _JAVA_LINE_TOK.finditer(content):
+        kind = match.lastgroup
+        if kind == 'code':
+            stats.code += 1
+            if code_lines is not None:
+                code_lines.append(match.group('code').rstrip())
+        elif kind == 'blank':
+            stats.blank += 1
+        elif kind == 'scom':
+            stats.single += 1
+        elif kind == 'jdoc':
+            stats.javadoc += match.group('jdoc').count('\n') + 1
+        elif kind == 'block':
+            stats.multi += match.group('block').count('\n') + 1
+        else:  # Stray Javadoc continuation line outside a tracked block
+            stats.multi += 1
+    return stats
+
+
+def _iter_files(root: str):
+    """Yield a DirEntry for every file below root, without following symlinked dirs.
+
+    DirEntry caches its stat result, so callers get file metadata without an
+    extra stat call per file. Unreadable directories and SKIP_DIRS are skipped.
+    """
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        yield from _iter_files(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except OSError:
+        return
+
+
+def _file_cache_key(file_path: str, file_stat: os.stat_result) -> tuple:
+    """Key identifying one version of a file in the analyze_file cache."""
+    return (file_path, file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def _cache_by_content(analyze):
+    """Memoize a CodeAnalyzer analysis method on a hash of its source.
+
+    The analyses are pure functions of the content, so re-analyzing an
+    unchanged file becomes a dict lookup. Only results that were slow to
+    compute are kept, and callers always get their own deep copy. Other
+    arguments, such as an already parsed tree, are derived from the source
+    and do not take part in the key.
+    """
+    @functools.wraps(analyze)
+    def wrapper(self, content, *args, **kwargs):
+        # The Java analyzer is also given the raw file bytes when they were
+        # read from disk; hashing those avoids re-encoding the content
+        if args and isinstance(args[0], bytes):
+            source = args[0]
+        else:
+            source = content.encode('utf-8')
+        key = (analyze.__name__,
+               hashlib.blake2b(source, digest_size=16).digest())
+        cached = self._analysis_cache.get(key)
+        if cached is None:
+            start = time.perf_counter()
+            result = analyze(self, content, *args, **kwargs)
+            if time.perf_counter() - start < ANALYSIS_CACHE_MIN_SECONDS:
+                return result
+            if len(self._analysis_cache) >= ANALYSIS_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest
+                del self._analysis_cache[next(iter(self._analysis_cache))]
+            self._analysis_cache[key] = cached = result
+        return copy.deepcopy(cached)
+    return wrapper
+
+
+class _ComplexityCounter(ast.NodeVisitor):
+    """Count decision points below a Python AST node."""
+
+    __slots__ = ('complexity',)
+
+    def __init__(self):
+        self.complexity = 1  # Base complexity
+
+    def visit_If(self, node):
+        self.complexity += 1
+        self.generic_visit(node)
+
+    visit_While = visit_For = visit_ExceptHandler = visit_If
+
+    def visit_BoolOp(self, node):
+        self.complexity += len(node.values) - 1
+        self.generic_visit(node)
+
+
+class _PyCollector(ast.NodeVisitor):
+    """Collect functions, classes and imports from a Python AST in one pass."""
+
+    __slots__ = ('functions', 'classes', 'method_counts', 'imports',
+                 '_class_stack')
+
+    def __init__(self):
+        self.functions = []
+        self.classes = []
+        self.method_counts = []  # Functions nested in each class, by index
+        self.imports = []
+        self._class_stack = []
+
+    def visit_FunctionDef(self, node):
+        self.functions.append(node)
+        for index in self._class_stack:
+            self.method_counts[index] += 1
+        self.generic_visit(node)
+
+    def visit_ClassDef(self, node):
+        self._class_stack.append(len(self.classes))
+        self.classes.append(node)
+        self.method_counts.append(0)
+        self.generic_visit(node)
+        self._class_stack.pop()
+
+    def visit_Import(self, node):
+        self.imports.extend(alias.name for alias in node.names)
+
+    def visit_ImportFrom(self, node):
+        # Keep relative imports recognisable, e.g. "from . import x" -> "."
+        self.imports.append('.' * node.level + (node.module or ''))
+
+    def average_function_length(self) -> float:
+        """Average number of source lines spanned by the collected functions."""
+        if not self.functions:
+            return 0
+        total = sum(func.end_lineno - func.lineno + 1 for func in self.functions)
+        return total / len(self.functions)
+
+
+class _HalsteadVisitor(ast.NodeVisitor):
+    """Collect Halstead operators and operands from a Python AST in one pass.
+
+    Operators are recorded as their ast classes, which are distinct per
+    operator and hash by identity, so no class names are looked up.
+    """
+
+    __slots__ = ('operators', 'operands', 'total_operators', 'total_operands')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget everything collected so the visitor can be reused."""
+        self.operators = set()
+        self.operands = set()
+        self.total_operators = 0
+        self.total_operands = 0
+
+    def visit(self, node):
+        # Dispatch on the exact node type with one dict lookup, instead of
+        # NodeVisitor formatting a method name and probing for it per node
+        handler = self._handlers.get(type(node))
+        if handler is None:
+            self.generic_visit(node)
+        else:
+            handler(self, node)
+
+    def visit_Name(self, node):
+        self.operands.add(node.id)
+        self.total_operands += 1
+
+    def visit_Constant(self, node):
+        # Numbers and strings are operands; True, False, None and bytes
+        # are not counted
+        value = node.value
+        if type(value) in (int, float, complex):
+            self.operands.add(str(value))
+            self.total_operands += 1
+        elif type(value) is str:
+            self.operands.add(value)
+            self.total_operands += 1
+
+    def visit_BinOp(self, node):
+        self.operators.add(type(node.op))
+        self.total_operators += 1
+        self.generic_visit(node)
+
+    visit_AugAssign = visit_BinOp
+
+    def visit_BoolOp(self, node):
+        self.operators.add(type(node.op))
+        self.total_operators += 1
+        self.generic_visit(node)
+
+    def visit_Compare(self, node):
+        self.operators.update(map(type, node.ops))
+        self.total_operators += len(node.ops)
+        self.generic_visit(node)
+
+    _handlers = {
+        ast.Name: visit_Name,
+        ast.Constant: visit_Constant,
+        ast.BinOp: visit_BinOp,
+        ast.AugAssign: visit_AugAssign,
+        ast.BoolOp: visit_BoolOp,
+        ast.Compare: visit_Compare
+    }
 
 
 class CodeAnalyzer:
     def __init__(self, config):
         """Initialize CodeAnalyzer with configuration."""
         self.config = config
-        self.mime = magic.Magic(mime=True)
+        self._mime = None
+        self._file_cache = {}
+        self._analysis_cache = {}
+        self._parse_cache = {}
+        self._nesting_cache = {}
+        # Reused between calls, so an analyzer must not be shared by threads
+        self._halstead_visitor = _HalsteadVisitor()
+        self._cpp_parser = cpp_parser.CppParser()
+        self._csharp_parser = csharp_parser.CSharpParser()
         self.supported_languages = {
             'python': self._analyze_python,
             'java': self._analyze_generic,
@@ -36,6 +629,13 @@ class CodeAnalyzer:
             'csharp': self._analyze_generic
         }
 
+    @property
+    def mime(self):
+        """libmagic handle, opened on first use so the analyzer stays picklable."""
+        if self._mime is None:
+            self._mime = magic.Magic(mime=True)
+        return self._mime
+
     def analyze_project(self, project_path: str) -> Dict[str, Any]:
         """Analyze an entire project directory and return aggregated metrics."""
         try:
@@ -49,57 +649,79 @@ class CodeAnalyzer:
                     'comments': 0, 'multi': 0, 'blank': 0
                 },
                 'files_analyzed': 0,
+                'files_skipped': 0,
                 'total_files': 0
             }
+            max_bytes = self._config_value('max_bytes', DEFAULT_MAX_FILE_BYTES)
+
+            # Collect the files first so they can be analyzed in parallel;
+            # oversized (usually generated) files are not parsed at all
+            file_entries = []
+            for entry in _iter_files(project_path):
+                project_metrics['total_files'] += 1
+                if entry.name.endswith(PROJECT_EXTENSIONS):
+                    file_stat = entry.stat()
+                    if file_stat.st_size > max_bytes:
+                        project_metrics['files_skipped'] += 1
+                    else:
+                        file_entries.append((entry.path, file_stat))
+
+            # Per-file issue lists are collected and flattened once at the end
+            raw_keys = tuple(project_metrics['raw_metrics'])
+            raw_totals = Counter()
+            complexity_total = maintainability_total = performance_total = 0
+            complexity_issues = []
+            maintainability_issues = []
+            performance_issues = []
+            code_smells = []
+
+            for (file_path, _), file_metrics in zip(
+                    file_entries, self._analyze_files(file_entries)):
+                try:
+                    complexity = file_metrics['complexity']
+                    maintainability = file_metrics['maintainability']
+                    performance = file_metrics.get('performance')
+                    raw = file_metrics.get('raw_metrics', {})
+                    raw_counts = {key: raw.get(key, 0) for key in raw_keys}
+
+                    # Aggregate metrics
+                    complexity_total += complexity.get('score', 0)
+                    complexity_issues.append(complexity.get('issues') or ())
+
+                    maintainability_total += maintainability.get('score', 0)
+                    maintainability_issues.append(
+                        maintainability.get('issues') or ())
+
+                    code_smells.append(file_metrics.get('code_smells') or ())
 
-            # Walk through the project directory
-            for root, _, files in os.walk(project_path):
-                for file in files:
-                    if file.endswith(
-                            '.py'):  # Only analyze Python files for now
-                        file_path = os.path.join(root, file)
-                        try:
-                            file_metrics = self.analyze_file(file_path)
-
-                            # Aggregate metrics
-                            project_metrics['complexity']['score'] += file_metrics['complexity'].get(
-                                'score', 0)
-                            project_metrics['complexity']['issues'].extend(
-                                file_metrics['complexity'].get('issues', []))
-
-                            project_metrics['maintainability']['score'] += file_metrics['maintainability'].get(
-                                'score', 0)
-                            project_metrics['maintainability']['issues'].extend(
-                                file_metrics['maintainability'].get('issues', []))
-
-                            project_metrics['code_smells'].extend(
-                                file_metrics.get('code_smells', []))
-
-                            if 'performance' in file_metrics:
-                                project_metrics['performance']['score'] += file_metrics['performance'].get(
-                                    'score', 0)
-                                project_metrics['performance']['issues'].extend(
-                                    file_metrics['performance'].get('issues', []))
-
-                            # Aggregate raw metrics
-                            for key in project_metrics['raw_metrics'].keys():
-                                project_metrics['raw_metrics'][key] += file_metrics.get(
-                                    'raw_metrics', {}).get(key, 0)
-
-                            project_metrics['files_analyzed'] += 1
-                        except Exception as e:
-                            print(
-                                f"Error analyzing file {file_path}: {
-                                    str(e)}")
-                            continue
-
-                    project_metrics['total_files'] += 1
+                    if performance is not None:
+                        performance_total += performance.get('score', 0)
+                        performance_issues.append(
+                            performance.get('issues') or ())
+
+                    # Aggregate raw metrics
+                    raw_totals.update(raw_counts)
+
+                    project_metrics['files_analyzed'] += 1
+                except Exception as e:
+                    print(f"Error analyzing file {file_path}: {str(e)}")
+                    continue
+
+            project_metrics['complexity']['issues'] = list(
+                chain.from_iterable(complexity_issues))
+            project_metrics['maintainability']['issues'] = list(
+                chain.from_iterable(maintainability_issues))
+            project_metrics['performance']['issues'] = list(
+                chain.from_iterable(performance_issues))
+            project_metrics['code_smells'] = list(
+                chain.from_iterable(code_smells))
+            project_metrics['raw_metrics'].update(raw_totals)
 
             # Calculate average scores
-            if project_metrics['files_analyzed'] > 0:
-                project_metrics['complexity']['score'] /= project_metrics['files_analyzed']
-                project_metrics['maintainability']['score'] /= project_metrics['files_analyzed']
-                project_metrics['performance']['score'] /= project_metrics['files_analyzed']
+            files_analyzed = project_metrics['files_analyzed'] or 1
+            project_metrics['complexity']['score'] = complexity_total / files_analyzed
+            project_metrics['maintainability']['score'] = maintainability_total / files_analyzed
+            project_metrics['performance']['score'] = performance_total / files_analyzed
 
             return project_metrics
 
@@ -132,11 +754,103 @@ class CodeAnalyzer:
                     'multi': 0,
                     'blank': 0},
                 'files_analyzed': 0,
+                'files_skipped': 0,
                 'total_files': 0}
 
+    def analyze_files(self, file_paths: List[str]) -> List[Dict]:
+        """Analyze several files and return their metrics in input order.
+
+        Like analyze_project, enough uncached files are spread over a
+        process pool. Files that cannot be stat'ed get the error result
+        analyze_file reports for them.
+        """
+        file_entries = []
+        for file_path in file_paths:
+            try:
+                file_entries.append((file_path, os.stat(file_path)))
+            except OSError:
+                continue
+        results = dict(zip(
+            (file_path for file_path, _ in file_entries),
+            self._analyze_files(file_entries)))
+        return [results.get(file_path) or self.analyze_file(file_path)
+                for file_path in file_paths]
+
+    def _analyze_files(self, file_entries: List[tuple]) -> List[Dict]:
+        """Analyze (path, stat) pairs and return their metrics in input order.
+
+        Files whose cached result is still current are not re-analyzed; the
+        rest run in a process pool and their results are cached here. Like
+        analyze_file, every returned dict is the caller's own copy.
+
+        The pool is only used with more than one CPU and at least
+        PARALLEL_MIN_FILES files to analyze. If it fails as a whole, for
+        example with a BrokenProcessPool, the remaining files are analyzed
+        serially instead.
+        """
+        results = {}
+        missing = []
+        for file_path, file_stat in file_entries:
+            cached = self._file_cache.get(_file_cache_key(file_path, file_stat))
+            if cached is None:
+                missing.append((file_path, file_stat))
+            else:
+                results[file_path] = copy.deepcopy(cached)
+
+        workers = os.cpu_count() or 1
+        if workers > 1 and len(missing) >= PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(
+                        max_workers=workers,
+                        initializer=_init_worker,
+                        initargs=(self.config,)) as executor:
+                    analyzed = executor.map(
+                        _analyze_file_worker,
+                        [file_path for file_path, _ in missing],
+                        chunksize=16)
+                    for (file_path, file_stat), metrics in zip(
+                            missing, analyzed):
+                        results[file_path] = metrics
+                        if 'error' not in metrics:
+                            self._cache_metrics(
+                                _file_cache_key(file_path, file_stat), metrics)
+            except Exception as e:
+                # analyze_file handles its own errors, so anything raised
+                # here is a failure of the pool itself
+                print(f"Parallel analysis failed, continuing serially: {str(e)}")
+
+        for file_path, _ in missing:
+            if file_path not in results:
+                results[file_path] = self.analyze_file(file_path)
+
+        return [results[file_path] for file_path, _ in file_entries]
+
+    def _cache_metrics(self, cache_key: tuple, metrics: Dict) -> None:
+        """Store a copy of file metrics, evicting the oldest entry when full.
+
+        Callers keep and update the dicts they were given, so the cache
+        never shares an object with them.
+        """
+        if len(self._file_cache) >= FILE_CACHE_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest
+            del self._file_cache[next(iter(self._file_cache))]
+        self._file_cache[cache_key] = copy.deepcopy(metrics)
+
     def analyze_file(self, file_path: str, content: Optional[str] = None) -> Dict:
-        """Analyze a single file and return metrics."""
+        """Analyze a single file and return metrics.
+
+        When the content is read from disk, results are cached by path,
+        modification time and size, so unchanged files are not re-parsed.
+        Cached results are returned as copies the caller may modify.
+        """
         try:
+            cache_key = None
+            if content is None:
+                cache_key = _file_cache_key(file_path, os.stat(file_path))
+                cached = self._file_cache.get(cache_key)
+                if cached is not None:
+                    return copy.deepcopy(cached)
+
             metrics = {
                 'file_path': file_path,
                 'raw_metrics': {
@@ -168,9 +882,10 @@ class CodeAnalyzer:
             }
 
             # Read file content if not provided
+            source_bytes = None
             if content is None:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                source_bytes = Path(file_path).read_bytes()
+                content = _decode_source(source_bytes)
 
             # Get file extension
             ext = os.path.splitext(file_path)[1].lower()
@@ -181,15 +896,19 @@ class CodeAnalyzer:
             elif ext in ['.js', '.jsx', '.ts', '.tsx']:
                 metrics.update(self._analyze_javascript(content))
             elif ext == '.java':
-                metrics.update(self._analyze_java(content))
+                metrics.update(self._analyze_java(content, source_bytes))
             elif ext in ['.cpp', '.hpp', '.cc', '.h']:
                 metrics.update(self._analyze_cpp(content))
             else:
-                metrics.update(self._analyze_generic(content))
+                metrics.update(self._analyze_generic(
+                    content, _GENERIC_LANGUAGES.get(ext)))
 
             # Store the content for display
             metrics['content'] = content
-            
+
+            if cache_key is not None:
+                self._cache_metrics(cache_key, metrics)
+
             return metrics
 
         except Exception as e:
@@ -201,18 +920,9 @@ class CodeAnalyzer:
 
     def _calculate_function_complexity(self, node: ast.AST) -> int:
         """Calculate cyclomatic complexity of a function."""
-        complexity = 1  # Base complexity
-        for child in ast.walk(node):
-            if isinstance(
-                child,
-                (ast.If,
-                 ast.While,
-                 ast.For,
-                 ast.ExceptHandler)):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-        return complexity
+        counter = _ComplexityCounter()
+        counter.visit(node)
+        return counter.complexity
 
     def _calculate_maintainability_score(self, metrics: Dict) -> float:
         """Calculate maintainability score based on various metrics."""
@@ -250,20 +960,18 @@ class CodeAnalyzer:
 
     def _calculate_basic_metrics(self, content: str) -> Dict[str, Any]:
         """Calculate basic metrics when detailed parsing fails."""
-        lines = content.splitlines()
-        non_empty_lines = [l for l in lines if l.strip()]
+        code_lines = []
+        stats = _scan_java_lines(content, code_lines)
 
         # Count basic metrics
-        total_lines = len(lines)
-        source_lines = len(non_empty_lines)
-        blank_lines = total_lines - source_lines
+        total_lines = _count_lines(content)
+        source_lines = total_lines - stats.blank
+        blank_lines = stats.blank
 
         # Count comments
-        single_comments = 0
-        multi_comments = 0
-        javadoc_comments = 0
-        in_multi_comment = False
-        in_javadoc = False
+        single_comments = stats.single
+        multi_comments = stats.multi
+        javadoc_comments = stats.javadoc
 
         # Track packages and imports
         declared_packages = []
@@ -279,43 +987,9 @@ class CodeAnalyzer:
         in_method = False
         brace_count = 0
 
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-
-            # Skip empty lines
-            if not line:
-                i += 1
-                continue
-
-            # Handle Javadoc comments
-            if line.startswith('/**'):
-                in_javadoc = True
-                javadoc_comments += 1
-                while i < len(lines) and '*/' not in lines[i]:
-                    javadoc_comments += 1
-                    i += 1
-                if i < len(lines):  # Count the closing line
-                    javadoc_comments += 1
-                in_javadoc = False
-
-            # Handle regular multi-line comments
-            elif line.startswith('/*'):
-                in_multi_comment = True
-                multi_comments += 1
-                while i < len(lines) and '*/' not in lines[i]:
-                    multi_comments += 1
-                    i += 1
-                if i < len(lines):  # Count the closing line
-                    multi_comments += 1
-                in_multi_comment = False
-
-            # Handle single-line comments
-            elif line.startswith('//'):
-                single_comments += 1
-
+        for line in code_lines:
             # Track packages and imports
-            elif line.startswith('package '):
+            if line.startswith('package '):
                 package_name = line[8:].rstrip(';').strip()
                 if package_name:
                     declared_packages.append(package_name)
@@ -335,19 +1009,16 @@ class CodeAnalyzer:
                 class_count += 1
 
             # Count methods and track their lengths
-            elif any(modifier + ' ' in line for modifier in ['public', 'private', 'protected']) and '(' in line and ')' in line:
+            elif _MODIFIER_RE.search(line) and '(' in line and ')' in line:
                 if '{' in line:  # Method declaration with opening brace
                     in_method = True
                     brace_count = 1
                     current_method_lines = 1
-                    if not any(
-                        c in line for c in [
-                            'class',
-                            'interface',
-                            'enum']):  # Ensure it's not a class/interface declaration
+                    # Ensure it's not a class/interface declaration
+                    if not _TYPE_DECL_RE.search(line):
                         method_count += 1
                 # Method declaration without opening brace
-                elif not any(c in line for c in ['class', 'interface', 'enum']):
+                elif not _TYPE_DECL_RE.search(line):
                     method_count += 1
 
             # Track method bodies
@@ -363,8 +1034,6 @@ class CodeAnalyzer:
             elif ('->' in line or 'new ' in line) and '{' in line:
                 function_count += 1
 
-            i += 1
-
         # Calculate average method length
         avg_method_length = sum(method_lines) / \
             len(method_lines) if method_lines else 0
@@ -400,40 +1069,45 @@ class CodeAnalyzer:
             'refactoring_opportunities': []
         }
 
+    @_cache_by_content
     def _analyze_python(self, content: str) -> Dict[str, Any]:
-        """Analyze Python code."""
+        """Analyze Python code.
+
+        The source is parsed once; radon's complexity, Halstead and
+        maintainability figures all come from that tree.
+        """
         try:
             tree = ast.parse(content)
 
-            # Count functions and classes
-            functions = [
-                node for node in ast.walk(tree) if isinstance(
-                    node, ast.FunctionDef)]
-            classes = [
-                node for node in ast.walk(tree) if isinstance(
-                    node, ast.ClassDef)]
-
-            # Analyze imports
-            imports = []
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    imports.extend(alias.name for alias in node.names)
-                elif isinstance(node, ast.ImportFrom):
-                    imports.append(f"{node.module}")
+            # Collect functions, classes and imports in one traversal
+            collector = _PyCollector()
+            collector.visit(tree)
+            functions = collector.functions
+            classes = collector.classes
+            imports = collector.imports
 
             # Calculate cyclomatic complexity
-            complexity_visitor = ComplexityVisitor.from_code(content)
+            complexity_visitor = ComplexityVisitor.from_ast(tree)
             complexity = sum(
                 item.complexity for item in complexity_visitor.functions)
 
-            # Calculate Halstead metrics
-            halstead = h_visit(content)
+            # Calculate Halstead metrics from the same tree
+            halstead = h_visit_ast(tree).total
 
-            # Calculate raw metrics
+            # Calculate raw metrics (radon needs the source for these)
             raw_metrics = analyze(content)
 
-            # Calculate maintainability index
-            mi_score = radon_metrics.mi_visit(content, multi=True)
+            # Calculate maintainability index from the results above; this
+            # is what mi_visit(content, multi=True) computes after parsing
+            # and analyzing the source again
+            comment_lines = raw_metrics.comments + raw_metrics.multi
+            comment_percent = (
+                comment_lines / raw_metrics.sloc * 100 if raw_metrics.sloc else 0)
+            mi_score = mi_compute(
+                halstead.volume,
+                complexity_visitor.total_complexity,
+                raw_metrics.lloc,
+                comment_percent)
             maintainability_score = min(100, max(0, mi_score))
 
             # Detect code smells
@@ -446,15 +1120,10 @@ class CodeAnalyzer:
                         f"Function '{func.name}' is too long ({len(func.body)} lines)")
 
             # Check class complexity
-            for cls in classes:
-                methods = [
-                    node for node in ast.walk(cls) if isinstance(
-                        node, ast.FunctionDef)]
-                if len(methods) > 10:
+            for cls, method_count in zip(classes, collector.method_counts):
+                if method_count > 10:
                     code_smells.append(
-                        f"Class '{
-                            cls.name}' has too many methods ({
-                            len(methods)})")
+                        f"Class '{cls.name}' has too many methods ({method_count})")
 
             # Check nesting depth
             for func in functions:
@@ -485,7 +1154,7 @@ class CodeAnalyzer:
                     "blank": raw_metrics.blank,
                     "classes": len(classes),
                     "functions": len(functions),
-                    "average_method_length": self._get_basic_metrics(content)['average_line_length'],
+                    "average_method_length": collector.average_function_length(),
                     "max_complexity": complexity,
                     "comment_ratio": (
                         raw_metrics.comments +
@@ -518,25 +1187,29 @@ class CodeAnalyzer:
                 "performance": {
                     "score": 50,
                     "issues": ["Error analyzing code"]}}
+        finally:
+            self._nesting_cache.clear()
 
     def _analyze_javascript(self, content: str) -> Dict[str, Any]:
         """Analyze JavaScript/TypeScript code."""
         try:
-            # Parse JavaScript code
+            # Parse JavaScript code; esprima is only loaded when needed
+            import esprima
             tree = esprima.parseScript(content)
 
+            # Count every node type in a single walk
+            node_types = Counter(
+                getattr(node, 'type', None) for node in self._walk_js_ast(tree))
+
             # Count functions and classes
-            functions = len([node for node in self._walk_js_ast(
-                tree) if node.type == 'FunctionDeclaration'])
-            classes = len([node for node in self._walk_js_ast(
-                tree) if node.type == 'ClassDeclaration'])
+            functions = node_types['FunctionDeclaration']
+            classes = node_types['ClassDeclaration']
 
             # Count imports
-            imports = len([node for node in self._walk_js_ast(
-                tree) if node.type == 'ImportDeclaration'])
+            imports = node_types['ImportDeclaration']
 
             # Basic complexity calculation
-            complexity = self._calculate_js_complexity(tree)
+            complexity = self._calculate_js_complexity(node_types)
 
             return {
                 "language": "javascript",
@@ -555,74 +1228,36 @@ class CodeAnalyzer:
                 "error": str(e)
             }
 
-    def _analyze_java(self, content: str) -> Dict:
+    @_cache_by_content
+    def _analyze_java(self, content: str,
+                      source_bytes: Optional[bytes] = None) -> Dict:
         """Analyze Java code and return metrics."""
         try:
-            tree = javalang.parse.parse(content)
-            
-            # Count classes, methods, and imports
-            classes = list(tree.filter(javalang.tree.ClassDeclaration))
-            methods = list(tree.filter(javalang.tree.MethodDeclaration))
-            imports = list(tree.filter(javalang.tree.Import))
-            
-            # Calculate complexity
-            complexity_score = self._calculate_java_complexity(tree)
-            
+            summary = self._java_parse_summary(content, source_bytes)
+            complexity_score = summary['complexity']
+
             # Calculate maintainability score (inverse of complexity)
             maintainability_score = max(0, min(100, 100 - (complexity_score * 2)))
             
             # Count lines with improved accuracy
-            lines = content.splitlines()
-            loc = len(lines)  # Total lines
+            loc = _count_lines(content)  # Total lines
             
             # Count actual source lines (excluding comments and blank lines)
-            sloc = 0
-            in_multi_comment = False
-            single_comments = 0
-            multi_comments = 0
-            blank_lines = 0
-            
-            for line in lines:
-                stripped = line.strip()
-                if not stripped:  # Blank line
-                    blank_lines += 1
-                    continue
-                    
-                if stripped.startswith('/*') or stripped.startswith('/**'):
-                    in_multi_comment = True
-                    multi_comments += 1
-                    continue
-                    
-                if in_multi_comment:
-                    multi_comments += 1
-                    if '*/' in stripped:
-                        in_multi_comment = False
-                    continue
-                    
-                if stripped.startswith('//'):
-                    single_comments += 1
-                    continue
-                    
-                if stripped.startswith('*'):  # Part of Javadoc
-                    multi_comments += 1
-                    continue
-                    
-                if not in_multi_comment:
-                    sloc += 1
-            
+            stats = _scan_java_lines(content)
+            blank_lines = stats.blank
+            single_comments = stats.single
+            multi_comments = stats.multi + stats.javadoc
+            sloc = stats.code
+
             # Calculate comment ratio
             total_comments = single_comments + multi_comments
             comment_ratio = total_comments / loc if loc > 0 else 0
             
             # Count packages (unique import paths)
-            packages = set()
-            import_paths = []
-            for imp in imports:
-                if hasattr(imp, 'path'):
-                    import_path = imp.path
-                    import_paths.append(import_path)
-                    if '.' in import_path:
-                        packages.add(import_path.split('.')[0])
+            import_paths = summary['imports']
+            packages = {
+                import_path.split('.')[0]
+                for import_path in import_paths if '.' in import_path}
             
             return {
                 'language': 'java',
@@ -637,15 +1272,15 @@ class CodeAnalyzer:
                     'single_comments': single_comments,
                     'multi_comments': multi_comments,
                     'blank': blank_lines,
-                    'classes': len(classes),
-                    'methods': len(methods),
-                    'functions': len(methods),  # In Java, methods are functions
+                    'classes': summary['classes'],
+                    'methods': summary['methods'],
+                    'functions': summary['methods'],  # In Java, methods are functions
                     'comment_ratio': comment_ratio,
                     'packages': len(packages)  # Number of unique imported packages
                 },
                 'imports': import_paths,
                 'packages': list(packages),
-                'code_smells': self._detect_java_smells(tree),
+                'code_smells': summary['code_smells'],
                 'design_issues': [],
                 'performance_issues': [],
                 'security_issues': []
@@ -654,6 +1289,7 @@ class CodeAnalyzer:
             print(f"Error parsing Java code: {str(e)}")
             # Fallback to basic analysis when parsing fails
             basic_metrics = self._basic_java_analysis(content)
+            loc = _count_lines(content)
             return {
                 'language': 'java',
                 'complexity': {'score': basic_metrics['complexity'], 'issues': []},
@@ -661,8 +1297,8 @@ class CodeAnalyzer:
                 'cognitive_complexity': basic_metrics['complexity'],
                 'code_coverage': 0,
                 'raw_metrics': {
-                    'loc': len(content.splitlines()),
-                    'sloc': len([l for l in content.splitlines() if l.strip()]),
+                    'loc': loc,
+                    'sloc': loc - basic_metrics['blank_lines'],
                     'comments': basic_metrics['comments'],
                     'single_comments': basic_metrics['single_comments'],
                     'multi_comments': basic_metrics['multi_comments'],
@@ -681,10 +1317,123 @@ class CodeAnalyzer:
                 'security_issues': []
             }
 
+    def _config_value(self, key: str, default: Any = None) -> Any:
+        """Read a setting from either a plain dict or a Config object."""
+        if isinstance(self.config, dict):
+            return self.config.get(key, default)
+        return getattr(self.config, key, default)
+
+    @property
+    def _java_cache_dir(self) -> Path:
+        """Directory holding pickled Java parse summaries."""
+        return Path(self._config_value('cache_dir', DEFAULT_CACHE_DIR))
+
+    def _load_java_summary(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """Read a cached Java parse summary, or None if it is not usable.
+
+        Only regular files owned by the current user and no larger than
+        JAVA_CACHE_MAX_ENTRY_BYTES are unpickled. Unreadable, corrupt or
+        malformed entries are removed so they are rewritten.
+        """
+        try:
+            with open(cache_file, 'rb') as f:
+                file_stat = os.fstat(f.fileno())
+                if (file_stat.st_size > JAVA_CACHE_MAX_ENTRY_BYTES
+                        or (hasattr(os, 'getuid')
+                            and file_stat.st_uid != os.getuid())):
+                    return None
+                summary = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            summary = None
+
+        if isinstance(summary, dict) and summary.keys() == _JAVA_SUMMARY_KEYS:
+            return summary
+        try:
+            cache_file.unlink()
+        except OSError:
+            pass
+        return None
+
+    def _store_java_summary(self, cache_file: Path,
+                            summary: Dict[str, Any]) -> None:
+        """Write a Java parse summary and keep the cache within its size."""
+        cache_dir = cache_file.parent
+        try:
+            cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(summary, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"Could not write Java parse cache: {str(e)}")
+            return
+
+        # Worker processes prune the same directory concurrently, so any
+        # entry may already have been removed by another one
+        try:
+            entries = []
+            for entry in os.scandir(cache_dir):
+                if entry.name.endswith('.pkl'):
+                    try:
+                        entries.append((entry.stat().st_mtime_ns, entry.path))
+                    except FileNotFoundError:
+                        continue
+            excess = len(entries) - JAVA_CACHE_MAX_ENTRIES
+            if excess > 0:
+                # Remove the oldest entries first
+                entries.sort()
+                for _, path in entries[:excess]:
+                    try:
+                        os.unlink(path)
+                    except FileNotFoundError:
+                        continue
+        except OSError as e:
+            print(f"Could not prune Java parse cache: {str(e)}")
+
+    def _java_parse_summary(self, content: str,
+                            source_bytes: Optional[bytes] = None) -> Dict[str, Any]:
+        """Parse Java source into the primitive counts the metrics need.
+
+        javalang parsing dominates Java analysis, so the summary is pickled
+        under a hash of the source and reused whenever the same content is
+        analyzed again. The key includes JAVA_CACHE_VERSION, since the
+        summary holds computed scores. The raw file bytes are hashed when
+        available, so content read from disk is never re-encoded. Parse
+        errors propagate to the caller.
+        """
+        if source_bytes is None:
+            source_bytes = content.encode('utf-8')
+        digest = hashlib.blake2b(source_bytes, digest_size=16).hexdigest()
+        cache_file = (self._java_cache_dir
+                      / f"java-v{JAVA_CACHE_VERSION}-{digest}.pkl")
+        summary = self._load_java_summary(cache_file)
+        if summary is not None:
+            return summary
+
+        tree = javalang.parse.parse(content)
+        buckets = self._collect_java_nodes(tree)
+        try:
+            summary = {
+                'classes': len(buckets.get(javalang.tree.ClassDeclaration, ())),
+                'methods': len(buckets.get(javalang.tree.MethodDeclaration, ())),
+                'imports': [imp.path for imp in tree.imports if imp.path],
+                'package_name': tree.package.name if tree.package else None,
+                'complexity': self._calculate_java_complexity(buckets),
+                'code_smells': self._detect_java_smells(buckets)
+            }
+        finally:
+            self._nesting_cache.clear()
+
+        self._store_java_summary(cache_file, summary)
+        return summary
+
     def _basic_java_analysis(self, content: str) -> Dict:
         """Perform basic Java code analysis when full parsing fails."""
-        lines = content.splitlines()
-        
+        code_lines = []
+        stats = _scan_java_lines(content, code_lines)
+
         # Initialize metrics
         metrics = {
             'classes': 0,
@@ -692,118 +1441,76 @@ class CodeAnalyzer:
             'imports': 0,
             'complexity': 0,
             'comments': 0,
-            'single_comments': 0,
-            'multi_comments': 0,
-            'blank_lines': 0,
+            'single_comments': stats.single,
+            'multi_comments': stats.multi + stats.javadoc,
+            'blank_lines': stats.blank,
             'import_paths': [],
             'packages': set(),
             'smells': []
         }
 
-        # Process each line
-        in_multi_comment = False
-        for line in lines:
-            stripped = line.strip()
-            
-            # Skip blank lines
-            if not stripped:
-                metrics['blank_lines'] += 1
-                continue
-            
-            # Handle comments
-            if stripped.startswith('/*') or stripped.startswith('/**'):
-                in_multi_comment = True
-                metrics['multi_comments'] += 1
-                continue
-                
-            if in_multi_comment:
-                metrics['multi_comments'] += 1
-                if stripped.endswith('*/'):
-                    in_multi_comment = False
-                continue
-                
-            if stripped.startswith('//'):
-                metrics['single_comments'] += 1
-                continue
-                
-            if stripped.startswith('*'):  # Part of Javadoc
-                metrics['multi_comments'] += 1
-                continue
+        # Scan all code lines at once; the patterns match once per line
+        code = '\n'.join(code_lines)
+
+        # Count classes using regex
+        metrics['classes'] = sum(1 for _ in _JAVA_CLASS_RE.finditer(code))
+
+        # Count methods using regex
+        metrics['methods'] = sum(1 for _ in _JAVA_METHOD_RE.finditer(code))
 
-            # Count classes using regex
-            if re.search(r'\b(public|private|protected)?\s+class\s+\w+', stripped):
-                metrics['classes'] += 1
-
-            # Count methods using regex
-            if re.search(r'\b(public|private|protected)?\s+\w+\s+\w+\s*\([^)]*\)', stripped):
-                metrics['methods'] += 1
-
-            # Process imports
-            if stripped.startswith('import '):
-                metrics['imports'] += 1
-                import_match = re.search(r'import\s+([\w\.]+);', stripped)
-                if import_match:
-                    import_path = import_match.group(1)
-                    metrics['import_paths'].append(import_path)
-                    # Extract package name (first part of import path)
-                    package = import_path.split('.')[0]
-                    metrics['packages'].add(package)
+        # Process imports
+        for import_match in _JAVA_IMPORT_RE.finditer(code):
+            metrics['imports'] += 1
+            import_path = import_match.group(1)
+            if import_path:
+                metrics['import_paths'].append(import_path)
+                # Extract package name (first part of import path)
+                package = import_path.split('.')[0]
+                metrics['packages'].add(package)
 
         # Calculate total comments
         metrics['comments'] = metrics['single_comments'] + metrics['multi_comments']
         
         # Calculate comment ratio
-        total_lines = len(lines)
+        total_lines = _count_lines(content)
         metrics['comment_ratio'] = metrics['comments'] / total_lines if total_lines > 0 else 0
 
         # Basic complexity calculation
-        control_structures = [
-            r'\bif\b',
-            r'\bwhile\b',
-            r'\bfor\b',
-            r'\bswitch\b',
-            r'\bcatch\b',
-            r'\bcase\b'
-        ]
-        
-        metrics['complexity'] = 1  # Base complexity
-        for pattern in control_structures:
-            metrics['complexity'] += len(re.findall(pattern, content))
+        metrics['complexity'] = 1 + sum(
+            1 for _ in _JAVA_CONTROL_RE.finditer(content))
 
         # Convert packages set to list for return
         metrics['packages'] = list(metrics['packages'])
 
         return metrics
 
-    def _calculate_java_complexity(self, tree) -> int:
+    def _collect_java_nodes(self, tree) -> Dict[type, List]:
+        """Bucket every Java node by its exact type in a single tree traversal.
+
+        The buckets stand in for repeated tree.filter(...) calls; javalang's
+        node classes used here have no subclasses, so exact types suffice.
+        """
+        buckets = defaultdict(list)
+        for node in _java_walk(tree):
+            buckets[type(node)].append(node)
+        return buckets
+
+    def _calculate_java_complexity(self, buckets: Dict[type, List]) -> int:
         """Calculate cyclomatic complexity for Java code with improved accuracy."""
         complexity = 1  # Base complexity
 
-        # Define control structures with their weights
-        control_structures = [
-            (javalang.tree.IfStatement, 1),
-            (javalang.tree.ForStatement, 1),
-            (javalang.tree.WhileStatement, 1),
-            (javalang.tree.DoStatement, 1),
-            (javalang.tree.CatchClause, 1),
-            (javalang.tree.SwitchStatement, 1),
-            # Add weight for binary operations
-            (javalang.tree.BinaryOperation, 0.5)
-        ]
-
         try:
             # Count control structures
-            for node_type, weight in control_structures:
-                nodes = list(tree.filter(node_type))
-                complexity += len(nodes) * weight
+            for node_type, weight in _JAVA_CONTROL_WEIGHTS.items():
+                complexity += len(buckets.get(node_type, ())) * weight
 
             # Add complexity for nested structures
-            for path, node in tree.filter(javalang.tree.BlockStatement):
-                nesting_level = self._calculate_nesting_level(node)
+            for node in buckets.get(javalang.tree.BlockStatement, ()):
+                nesting_level = self._calculate_java_nesting_level(node)
                 complexity += nesting_level * 0.5
 
             # Add complexity for method parameters
-            for path, node in tree.filter(javalang.tree.MethodDeclaration):
+            for node in buckets.get(javalang.tree.MethodDeclaration, ()):
                 complexity += len(node.parameters) * 0.2
 
         except Exception as e:
@@ -812,19 +1519,23 @@ class CodeAnalyzer:
 
         return int(complexity)  # Return as integer to avoid floating point complexity
 
-    def _detect_java_smells(self, tree) -> List[str]:
+    def _detect_java_smells(self, buckets: Dict[type, List]) -> List[str]:
         """Detect code smells in Java code with improved detection."""
         smells = []
 
         try:
-            # Check for long methods
-            for path, method in tree.filter(javalang.tree.MethodDeclaration):
-                if method.body and len(list(method.body)) > 20:
+            # Check for long methods; body is already a statement list
+            for method in buckets.get(javalang.tree.MethodDeclaration, ()):
+                if method.body and len(method.body) > 20:
                     smells.append(f"Long method detected: {method.name}")
 
-            # Check for large classes
-            for path, class_decl in tree.filter(javalang.tree.ClassDeclaration):
-                if len(list(class_decl.methods)) > 10:
+            # Check for large classes, counting methods without building
+            # the filtered list that ClassDeclaration.methods returns
+            method_type = javalang.tree.MethodDeclaration
+            for class_decl in buckets.get(javalang.tree.ClassDeclaration, ()):
+                method_count = sum(
+                    1 for decl in class_decl.body if type(decl) is method_type)
+                if method_count > 10:
                     smells.append(f"Large class detected: {class_decl.name}")
 
             # Check for deep nesting
@@ -833,34 +1544,54 @@ class CodeAnalyzer:
             print(f"Error detecting Java smells: {str(e)}")
             return smells
 
-    def _count_operators(self, node) -> int:
-        """Count the number of operators in a binary operation."""
-        count = 1  # Count the current operator
-
-        if isinstance(node.left, javalang.tree.BinaryOperation):
-            count += self._count_operators(node.left)
-        if isinstance(node.right, javalang.tree.BinaryOperation):
-            count += self._count_operators(node.right)
-
-        return count
-
-    def _calculate_nesting_level(self, node, level=0) -> int:
-        """Calculate nesting level of a node."""
-        max_level = level
-        for child in node.children:
-            if isinstance(child, (javalang.tree.IfStatement,
-                                  javalang.tree.ForStatement,
-                                  javalang.tree.WhileStatement,
-                                  javalang.tree.DoStatement)):
-                child_level = self._calculate_nesting_level(child, level + 1)
-                max_level = max(max_level, child_level)
-        return max_level
+    def _calculate_java_nesting_level(self, node, level=0) -> int:
+        """Calculate nesting level of a Java node.
+
+        The depth below each node is memoized by id(node) for the current
+        analysis, so nested blocks do not walk the same subtree again.
+        """
+        depth = self._nesting_cache.get(id(node))
+        if depth is None:
+            depth = 0
+            for child in _java_children(node):
+                if type(child) in _JAVA_BRANCH_TYPES:
+                    depth = max(
+                        depth, self._calculate_java_nesting_level(child) + 1)
+            self._nesting_cache[id(node)] = depth
+        return level + depth
+
+    def _parser_metrics(self, language: str, parser, content: str) -> Dict:
+        """Run parser.analyze_file(content) once per distinct source.
+
+        The C++ and C# helpers all start from the same parser metrics, so
+        they are memoized on a hash of the content. The returned dict is
+        shared between callers and must not be modified.
+        """
+        key = (language,
+               hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest())
+        metrics = self._parse_cache.get(key)
+        if metrics is None:
+            metrics = parser.analyze_file(content)
+            if len(self._parse_cache) >= ANALYSIS_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest
+                del self._parse_cache[next(iter(self._parse_cache))]
+            self._parse_cache[key] = metrics
+        return metrics
+
+    def _cpp_metrics(self, content: str) -> Dict:
+        """CppParser metrics for the content, parsed once per source."""
+        return self._parser_metrics('cpp', self._cpp_parser, content)
+
+    def _csharp_metrics(self, content: str) -> Dict:
+        """CSharpParser metrics for the content, parsed once per source."""
+        return self._parser_metrics('csharp', self._csharp_parser, content)
 
+    @_cache_by_content
     def _analyze_cpp(self, content: str) -> Dict[str, Any]:
         """Analyze C++ code."""
         try:
-            parser = cpp_parser.CppParser()
-            metrics = parser.analyze_file(content)
+            parser = self._cpp_parser
+            metrics = dict(self._cpp_metrics(content))
 
             # Add additional metrics
             metrics.update({
@@ -881,16 +1612,26 @@ class CodeAnalyzer:
     def _analyze_code_quality(self, content: str) -> Dict:
         """Analyze code quality metrics."""
         try:
-            lines = content.splitlines()
-            non_empty_lines = [l for l in lines if l.strip()]
-            comment_lines = [l for l in lines if l.strip().startswith('#')]
-            
+            # Count, measure and classify every line in a single pass
+            non_empty = comments = total_length = max_length = 0
+            for line in content.splitlines():
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                non_empty += 1
+                length = len(line)
+                total_length += length
+                if length > max_length:
+                    max_length = length
+                if stripped[0] == '#':
+                    comments += 1
+
             metrics = {
-                'non_empty_lines': len(non_empty_lines),
-                'comment_lines': len(comment_lines),
-                'comment_ratio': len(comment_lines) / len(non_empty_lines) if non_empty_lines else 0,
-                'avg_line_length': sum(len(l) for l in non_empty_lines) / len(non_empty_lines) if non_empty_lines else 0,
-                'max_line_length': max((len(l) for l in non_empty_lines), default=0)
+                'non_empty_lines': non_empty,
+                'comment_lines': comments,
+                'comment_ratio': comments / non_empty if non_empty else 0,
+                'avg_line_length': total_length / non_empty if non_empty else 0,
+                'max_line_length': max_length
             }
             return metrics
         except Exception as e:
@@ -902,22 +1643,9 @@ class CodeAnalyzer:
         try:
             if isinstance(content, str):
                 # Count control structures
-                control_structures = [
-                    r'if\s*\([^)]*\)',
-                    r'else\s*{',
-                    r'for\s*\([^)]*\)',
-                    r'while\s*\([^)]*\)',
-                    r'switch\s*\([^)]*\)',
-                    r'catch\s*\([^)]*\)',
-                    r'&&',
-                    r'\|\|',
-                    r'\?',
-                    r':'
-                ]
-
                 complexity = 1  # Base complexity
-                for pattern in control_structures:
-                    complexity += len(re.findall(pattern, content))
+                for pattern in _C_STYLE_CONTROL_RES:
+                    complexity += sum(1 for _ in pattern.finditer(content))
 
                 return complexity
 
@@ -925,18 +1653,16 @@ class CodeAnalyzer:
                 # Python AST-based complexity calculation
                 complexity = 1
 
-                for node in ast.walk(content):
-                    if isinstance(
-                        node,
-                        (ast.If,
-                         ast.While,
-                         ast.For,
-                         ast.AsyncFor,
-                         ast.Try,
-                         ast.With,
-                         ast.AsyncWith)):
+                # Walk with an explicit stack; the count does not depend on
+                # the order, and this avoids ast.walk's generator
+                stack = [content]
+                while stack:
+                    node = stack.pop()
+                    stack.extend(ast.iter_child_nodes(node))
+                    node_type = type(node)
+                    if node_type in _PY_CONTROL_TYPES:
                         complexity += 1
-                    elif isinstance(node, ast.BoolOp):
+                    elif node_type is ast.BoolOp:
                         complexity += len(node.values) - 1
 
                 return complexity
@@ -949,9 +1675,10 @@ class CodeAnalyzer:
     def get_syntax_highlighted_code(self, content: str, language: str) -> str:
         """Get syntax highlighted HTML for code."""
         try:
-            lexer = get_lexer_by_name(language)
-            formatter = HtmlFormatter(style='monokai')
-            return pygments.highlight(content, lexer, formatter)
+            import pygments
+
+            return pygments.highlight(
+                content, _pygments_lexer(language), _pygments_formatter())
         except Exception:
             return content
 
@@ -959,20 +1686,13 @@ class CodeAnalyzer:
         """Analyze Python code for performance issues."""
         issues = []
 
-        # Loop optimization detection
-        for node in ast.walk(tree):
-            if isinstance(node, ast.For):
-                if isinstance(node.iter, ast.Call):
-                    if isinstance(node.iter.func, ast.Name):
-                        if node.iter.func.id == 'range':
-                            # Check for range(len()) pattern
-                            if isinstance(node.iter.args[0], ast.Call):
-                                if isinstance(
-                                        node.iter.args[0].func, ast.Name):
-                                    if node.iter.args[0].func.id == 'len':
-                                        issues.append(
-                                            f"Consider using enumerate() instead of range(len()) at line {
-                                                node.lineno}")
+        # Loop optimization detection; only statements can be loops
+        for node in _walk_python_statements(tree):
+            # Check for range(len()) pattern
+            if type(node) is ast.For and _is_range_len_call(node.iter):
+                issues.append(
+                    f"Consider using enumerate() instead of range(len()) at line {
+                        node.lineno}")
 
         return {
             'score': 100 - len(issues) * 10,
@@ -988,37 +1708,47 @@ class CodeAnalyzer:
 
     def _detect_python_smells(self, tree: ast.AST) -> List[str]:
         """Detect code smells in Python code."""
-        smells = []
+        long_methods = []
+        deep_nesting = []
+        depths = _python_nesting_depths(tree)
 
-        # Long method detection
         for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
+            node_type = type(node)
+
+            # Long method detection
+            if node_type is ast.FunctionDef:
                 if len(node.body) > 20:  # More than 20 lines
-                    smells.append(f"Long method detected: {node.name}")
+                    long_methods.append(f"Long method detected: {node.name}")
 
-        # Deep nesting detection
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.If, ast.For, ast.While)):
-                nesting_level = self._calculate_nesting_level(node)
-                if nesting_level > 4:  # More than 4 levels deep
-                    smells.append(f"Deep nesting detected at line {node.lineno}")
+            # Deep nesting detection
+            elif node_type in _PY_BRANCH_TYPES:
+                if depths[id(node)] > 4:  # More than 4 levels deep
+                    deep_nesting.append(
+                        f"Deep nesting detected at line {node.lineno}")
 
-        return smells
+        return long_methods + deep_nesting
 
     def _calculate_nesting_level(self, node: ast.AST, level: int = 0) -> int:
-        """Calculate nesting level of a node."""
-        max_level = level
-        for child in ast.iter_child_nodes(node):
-            if isinstance(child, (ast.If, ast.For, ast.While)):
-                child_level = self._calculate_nesting_level(child, level + 1)
-                max_level = max(max_level, child_level)
-        return max_level
-
+        """Calculate nesting level of a node.
+
+        The depth below each node is memoized by id(node) for the current
+        analysis, so nested branches do not walk the same subtree again.
+        """
+        depth = self._nesting_cache.get(id(node))
+        if depth is None:
+            depth = 0
+            for child in ast.iter_child_nodes(node):
+                if type(child) in _PY_BRANCH_TYPES:
+                    depth = max(depth, self._calculate_nesting_level(child) + 1)
+            self._nesting_cache[id(node)] = depth
+        return level + depth
+
+    @_cache_by_content
     def _analyze_csharp(self, content: str) -> Dict:
         """Analyze C# code."""
         try:
-            parser = csharp_parser.CSharpParser()
-            metrics = parser.analyze_file(content)
+            parser = self._csharp_parser
+            metrics = dict(self._csharp_metrics(content))
 
             # Add additional metrics
             metrics.update({
@@ -1049,13 +1779,11 @@ class CodeAnalyzer:
 
     def _calculate_csharp_complexity(self, content: str) -> int:
         """Calculate cyclomatic complexity for C# code."""
-        parser = csharp_parser.CSharpParser()
-        return parser.analyze_file(content)['complexity']
+        return self._csharp_metrics(content)['complexity']
 
     def _calculate_csharp_maintainability(self, content: str) -> Dict:
         """Calculate maintainability metrics for C# code."""
-        parser = csharp_parser.CSharpParser()
-        metrics = parser.analyze_file(content)
+        metrics = self._csharp_metrics(content)
 
         # Calculate maintainability score based on various factors
         score = 100
@@ -1080,15 +1808,15 @@ class CodeAnalyzer:
     def _analyze_csharp_performance(self, content: str) -> Dict:
         """Analyze C# code for performance issues."""
         issues = []
-        parser = csharp_parser.CSharpParser()
+        found = {match.group() for match in _CSHARP_PERF_RE.finditer(content)}
 
         # Check for virtual methods in performance-critical code
-        if 'virtual' in content and 'sealed' not in content:
+        if 'virtual' in found and 'sealed' not in found:
             issues.append(
                 "Consider sealing virtual methods for better performance")
 
         # Check for unnecessary boxing/unboxing
-        if 'object' in content and 'var' not in content:
+        if 'object' in found and 'var' not in found:
             issues.append(
                 "Consider using var to avoid unnecessary boxing/unboxing")
 
@@ -1100,28 +1828,25 @@ class CodeAnalyzer:
     def _detect_cpp_smells(self, content: str) -> List[str]:
         """Detect code smells in C++ code."""
         smells = []
-        parser = cpp_parser.CppParser()
 
         # Check for long functions
-        for func in parser.get_function_signatures(content):
+        for func in self._cpp_parser.get_function_signatures(content):
             if len(func) > 50:  # More than 50 lines
                 smells.append(f"Long function detected: {func}")
 
         # Check for deep nesting
-        if parser.analyze_file(content)['complexity'] > 10:
+        if self._cpp_metrics(content)['complexity'] > 10:
             smells.append("High cyclomatic complexity detected")
 
         return smells
 
     def _calculate_cpp_complexity(self, content: str) -> int:
         """Calculate cyclomatic complexity for C++ code."""
-        parser = cpp_parser.CppParser()
-        return parser.analyze_file(content)['complexity']
+        return self._cpp_metrics(content)['complexity']
 
     def _calculate_cpp_maintainability(self, content: str) -> Dict:
         """Calculate maintainability metrics for C++ code."""
-        parser = cpp_parser.CppParser()
-        metrics = parser.analyze_file(content)
+        metrics = self._cpp_metrics(content)
 
         # Calculate maintainability score based on various factors
         score = 100
@@ -1146,15 +1871,15 @@ class CodeAnalyzer:
     def _analyze_cpp_performance(self, content: str) -> Dict:
         """Analyze C++ code for performance issues."""
         issues = []
-        parser = cpp_parser.CppParser()
+        found = {match.group() for match in _CPP_PERF_RE.finditer(content)}
 
         # Check for virtual functions in performance-critical code
-        if 'virtual' in content and 'inline' not in content:
+        if 'virtual' in found and 'inline' not in found:
             issues.append(
                 "Consider using inline functions for performance-critical code")
 
         # Check for unnecessary object copying
-        if 'const&' not in content:
+        if 'const&' not in found:
             issues.append(
                 "Consider using const references to avoid unnecessary copying")
 
@@ -1180,44 +1905,48 @@ class CodeAnalyzer:
         pass
 
     def _walk_js_ast(self, node):
-        """Walk JavaScript AST."""
-        yield node
-        for key, value in node.__dict__.items():
-            if isinstance(value, list):
-                for item in value:
-                    if hasattr(item, '__dict__'):
-                        yield from self._walk_js_ast(item)
-            elif hasattr(value, '__dict__'):
-                yield from self._walk_js_ast(value)
-
-    def _calculate_js_complexity(self, tree) -> int:
-        """Calculate complexity for JavaScript code."""
-        complexity = 0
-
+        """Walk JavaScript AST depth first with an explicit stack.
+
+        Child objects are recognized by esprima's Object base class; most
+        attribute values are strings, for which hasattr(value, '__dict__')
+        has to raise and swallow an AttributeError.
+        """
+        from esprima.objects import Object
+
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            yield node
+            for value in vars(node).values():
+                if isinstance(value, Object):
+                    stack.append(value)
+                elif isinstance(value, list):
+                    stack.extend(
+                        item for item in value if isinstance(item, Object))
+
+    def _calculate_js_complexity(self, node_types: Counter) -> int:
+        """Calculate complexity for JavaScript code from its node type counts."""
         # Count control flow statements
-        for node in self._walk_js_ast(tree):
-            if node.type in [
-                'IfStatement',
-                'WhileStatement',
-                'ForStatement',
-                    'SwitchStatement']:
-                complexity += 1
-
-        return complexity
+        return sum(node_types[node_type] for node_type in (
+            'IfStatement',
+            'WhileStatement',
+            'ForStatement',
+            'SwitchStatement'))
 
     def _calculate_scores(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate final scores and format results for visualization."""
+        complexity = metrics.get('complexity', 0)
+        maintainability = metrics.get('maintainability', {}).get('score', 70)
+        max_line_length = metrics.get('max_line_length', 0)
+        function_count = metrics.get('function_count', 0)
+        average_line_length = metrics.get('average_line_length', 0)
+        imports = metrics.get('imports', [])
 
         # Calculate complexity score (0-100, lower is better)
-        complexity_score = min(
-            100, max(0, 100 - (metrics.get('complexity', 0) * 5)))
+        complexity_score = min(100, max(0, 100 - (complexity * 5)))
 
         # Calculate maintainability score (0-100, higher is better)
-        maintainability_score = min(
-            100, max(
-                0, metrics.get(
-                    'maintainability', {}).get(
-                    'score', 70)))
+        maintainability_score = min(100, max(0, maintainability))
 
         # Calculate performance score (0-100)
         performance_score = 85  # Default good performance score
@@ -1227,20 +1956,20 @@ class CodeAnalyzer:
         if complexity_score < 60:
             complexity_issues.append(
                 "High cyclomatic complexity detected. Consider breaking down complex functions.")
-        if metrics.get('max_line_length', 0) > 100:
+        if max_line_length > 100:
             complexity_issues.append(
                 "Some lines are too long. Consider breaking them into smaller chunks.")
 
         code_smells = []
-        if metrics.get('function_count', 0) > 20:
+        if function_count > 20:
             code_smells.append(
                 "Too many functions in one file. Consider splitting into multiple files.")
-        if metrics.get('average_line_length', 0) > 50:
+        if average_line_length > 50:
             code_smells.append(
                 "Average line length is high. Consider improving code readability.")
 
         performance_issues = []
-        if metrics.get('imports', []) and len(metrics.get('imports', [])) > 15:
+        if imports and len(imports) > 15:
             performance_issues.append(
                 "Large number of imports may impact performance.")
 
@@ -1258,8 +1987,17 @@ class CodeAnalyzer:
                 'score': performance_score,
                 'issues': performance_issues}}
 
-    def _analyze_generic(self, content: str) -> Dict[str, Any]:
-        """Generic analysis for unsupported languages."""
+    def _analyze_generic(self, content: str,
+                         language: Optional[str] = None) -> Dict[str, Any]:
+        """Generic analysis for unsupported languages.
+
+        When the language is known and is not Python, the Halstead metrics
+        skip straight to tokenizing the source.
+        """
+        if language is None or language == 'python':
+            halstead_metrics = self._calculate_halstead_metrics(content)
+        else:
+            halstead_metrics = self._calculate_token_halstead_metrics(content)
         return {
             'complexity': {
                 'score': 50,
@@ -1272,14 +2010,13 @@ class CodeAnalyzer:
                 'score': 50,
                 'issues': ["Language not fully supported yet"]},
             'raw_metrics': self._get_basic_metrics(content),
-            'halstead_metrics': self._calculate_halstead_metrics(content)}
+            'halstead_metrics': halstead_metrics}
 
     def _calculate_complexity_metrics(self, content: str) -> Dict[str, Any]:
         """Calculate code complexity metrics."""
         try:
             # Calculate cyclomatic complexity using radon
-            complexity = cc_visit(content)
-            total_complexity = sum(item.complexity for item in complexity)
+            total_complexity = _radon_total_complexity(content)
 
             # Generate complexity score (0-100, lower complexity is better)
             score = max(0, min(100, 100 - (total_complexity * 5)))
@@ -1288,7 +2025,7 @@ class CodeAnalyzer:
             if total_complexity > 10:
                 issues.append(
                     "High cyclomatic complexity detected. Consider breaking down complex functions.")
-            if len(content.split('\n')) > 300:
+            if content.count('\n') + 1 > 300:
                 issues.append(
                     "File is too long. Consider splitting it into multiple files.")
 
@@ -1305,7 +2042,7 @@ class CodeAnalyzer:
         """Calculate code maintainability metrics."""
         try:
             # Calculate maintainability index using radon
-            mi_score = radon_metrics.mi_visit(content, multi=True)
+            mi_score = _radon_maintainability_index(content)
 
             # Convert to 0-100 scale
             score = max(0, min(100, mi_score))
@@ -1314,8 +2051,10 @@ class CodeAnalyzer:
             if score < 65:
                 issues.append(
                     "Low maintainability index. Consider improving code structure and documentation.")
-            if len([line for line in content.split('\n') if line.strip(
-            ).startswith('#')]) < len(content.split('\n')) * 0.1:
+            lines = content.split('\n')
+            comment_lines = sum(
+                1 for line in lines if line.lstrip().startswith('#'))
+            if comment_lines < len(lines) * 0.1:
                 issues.append(
                     "Low comment ratio. Consider adding more documentation.")
 
@@ -1329,32 +2068,32 @@ class CodeAnalyzer:
 
     def _detect_code_smells(self, content: str) -> List[str]:
         """Detect code smells."""
-        smells = []
-        lines = content.split('\n')
-
-        # Check line length
-        for i, line in enumerate(lines, 1):
-            if len(line.strip()) > 100:
-                smells.append(f"Line {i} is too long ({len(line)} characters)")
-
-        # Check function length
-        current_function = []
-        for line in lines:
-            if line.strip().startswith('def '):
-                if len(current_function) > 20:
-                    smells.append(
-                        f"Function is too long ({
-                            len(current_function)} lines)")
-                current_function = []
-            current_function.append(line)
-
-        # Check nesting depth
+        long_lines = []
+        long_functions = []
+        function_length = 0
         max_depth = 0
-        current_depth = 0
-        for line in lines:
-            indent = len(line) - len(line.lstrip())
-            depth = indent // 4
-            max_depth = max(max_depth, depth)
+
+        # Check line length, function length and nesting depth in one pass
+        for i, line in enumerate(content.split('\n'), 1):
+            unindented = line.lstrip()
+            stripped = unindented.rstrip()
+
+            if len(stripped) > 100:
+                long_lines.append(
+                    f"Line {i} is too long ({len(line)} characters)")
+
+            if stripped.startswith('def '):
+                if function_length > 20:
+                    long_functions.append(
+                        f"Function is too long ({function_length} lines)")
+                function_length = 0
+            function_length += 1
+
+            depth = (len(line) - len(unindented)) >> 2
+            if depth > max_depth:
+                max_depth = depth
+
+        smells = long_lines + long_functions
         if max_depth > 4:
             smells.append(f"Deep nesting detected (depth: {max_depth})")
 
@@ -1364,20 +2103,20 @@ class CodeAnalyzer:
         """Analyze code for performance issues."""
         issues = []
         score = 100
+        found = {match.group() for match in _PY_PERF_RE.finditer(content)}
 
         # Check for common performance issues
-        if 'import *' in content:
+        if 'import *' in found:
             issues.append(
                 "Using 'import *' can slow down imports and create namespace issues")
             score -= 20
 
-        if 'while True:' in content:
+        if 'while True:' in found:
             issues.append(
                 "Infinite loop detected. Ensure proper exit conditions")
             score -= 15
 
-        if '.copy()' not in content and any(
-                op in content for op in ['list(', 'dict(']):
+        if '.copy()' not in found and ('list(' in found or 'dict(' in found):
             issues.append(
                 "Consider using .copy() for mutable objects to prevent unintended modifications")
             score -= 10
@@ -1387,123 +2126,85 @@ class CodeAnalyzer:
             'issues': issues
         }
 
-    def _calculate_halstead_metrics(self, code: str) -> dict:
-        """Calculate Halstead metrics for the given code."""
+    @_cache_by_content
+    def _calculate_halstead_metrics(self, code: str,
+                                    tree: Optional[ast.AST] = None) -> dict:
+        """Calculate Halstead metrics for the given code.
+
+        Callers that already parsed the code as Python can pass the tree
+        to skip parsing it again.
+        """
         try:
+            # Handle empty or invalid code
+            if not code or not code.strip():
+                return self._get_default_halstead_metrics()
+
             # Initialize metrics
             operators = set()
             operands = set()
             total_operators = 0
             total_operands = 0
 
-            # Basic operators in most programming languages
-            basic_operators = {
-                '+', '-', '*', '/', '%', '=', '==', '!=', '<', '>', '<=', '>=',
-                '&&', '||', '!', '++', '--', '+=', '-=', '*=', '/=', '%=',
-                'and', 'or', 'not', 'in', 'is', 'lambda', 'if', 'else', 'elif',
-                'for', 'while', 'return', 'yield', 'break', 'continue', 'pass'
-            }
-
-            # Handle empty or invalid code
-            if not code or not code.strip():
-                return self._get_default_halstead_metrics()
-
             try:
                 # Try to parse as valid Python code first
-                tree = ast.parse(code)
-
-                # Walk the AST to collect operators and operands
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Name):
-                        operands.add(node.id)
-                        total_operands += 1
-                    elif isinstance(node, ast.Num):
-                        operands.add(str(node.n))
-                        total_operands += 1
-                    elif isinstance(node, ast.Str):
-                        operands.add(node.s)
-                        total_operands += 1
-                    elif isinstance(node, ast.operator):
-                        operators.add(node.__class__.__name__)
-                        total_operators += 1
-                    elif isinstance(node, ast.BoolOp):
-                        operators.add(node.op.__class__.__name__)
-                        total_operators += 1
-                    elif isinstance(node, ast.Compare):
-                        for op in node.ops:
-                            operators.add(op.__class__.__name__)
-                            total_operators += 1
+                if tree is None:
+                    tree = ast.parse(code)
+
+                # Visit the AST once to collect operators and operands
+                visitor = self._halstead_visitor
+                visitor.reset()
+                visitor.visit(tree)
+                operators = visitor.operators
+                operands = visitor.operands
+                total_operators = visitor.total_operators
+                total_operands = visitor.total_operands
 
             except SyntaxError:
                 # Fallback to basic tokenization for non-Python code
                 try:
-                    code_lines = code.splitlines()
-                    for line in code_lines:
-                        line = line.strip()
-                        if not line or line.startswith(
-                                ('#', '//', '/*', '*', '*/')):
-                            continue
-
-                        # Split line into tokens
-                        tokens = line.split()
-                        for token in tokens:
-                            if token in basic_operators:
-                                operators.add(token)
-                                total_operators += 1
-                            else:
-                                operands.add(token)
-                                total_operands += 1
+                    return _halstead_from_counts(*_halstead_token_counts(code))
                 except Exception as e:
                     print(f"Error in basic tokenization: {str(e)}")
                     return self._get_default_halstead_metrics()
 
             # Calculate Halstead metrics
-            # Number of unique operators (prevent division by zero)
-            n1 = len(operators) or 1
-            n2 = len(operands) or 1   # Number of unique operands
-            N1 = total_operators or 1  # Total operators
-            N2 = total_operands or 1   # Total operands
-
-            vocabulary = n1 + n2
-            length = N1 + N2
-            volume = length * math.log2(vocabulary)
-            difficulty = (n1 / 2) * (N2 / n2)
-            effort = difficulty * volume
-            time = effort / 18  # Estimated time in seconds
-            bugs = volume / 3000  # Estimated number of bugs
-
-            return {
-                'vocabulary': round(vocabulary, 2),
-                'length': round(length, 2),
-                'volume': round(volume, 2),
-                'difficulty': round(difficulty, 2),
-                'effort': round(effort, 2),
-                'time': round(time, 2),
-                'bugs': round(bugs, 3)
-            }
+            return _halstead_from_counts(
+                len(operators), len(operands), total_operators, total_operands)
 
         except Exception as e:
             print(f"Error calculating Halstead metrics: {str(e)}")
             return self._get_default_halstead_metrics()
 
+    @_cache_by_content
+    def _calculate_token_halstead_metrics(self, code: str) -> dict:
+        """Calculate Halstead metrics for code known not to be Python.
+
+        This is the tokenizer fallback of _calculate_halstead_metrics
+        without the ast.parse attempt, which for other languages only ends
+        in a SyntaxError.
+        """
+        if not code or not code.strip():
+            return self._get_default_halstead_metrics()
+        try:
+            return _halstead_from_counts(*_halstead_token_counts(code))
+        except Exception as e:
+            print(f"Error in basic tokenization: {str(e)}")
+            return self._get_default_halstead_metrics()
+
     def _get_default_halstead_metrics(self) -> dict:
-        """Return default Halstead metrics."""
-        return {
-            'vocabulary': 0,
-            'length': 0,
-            'volume': 0,
-            'difficulty': 0,
-            'effort': 0,
-            'time': 0,
-            'bugs': 0
-        }
+        """Return default Halstead metrics.
+
+        The result ends up in the metrics dict handed to callers, who may
+        update or serialize it, so it is a plain dict copy of the defaults.
+        """
+        return dict(_DEFAULT_HALSTEAD_METRICS)
 
     def _get_basic_metrics(self, content, language=None):
         """Get basic code metrics regardless of language."""
         try:
             lines = content.splitlines()
             total_lines = len(lines)
-            blank_lines = len([line for line in lines if not line.strip()])
+            blank_lines = 0
             comment_lines = 0
             code_lines = 0
             
@@ -1526,8 +2227,9 @@ class CodeAnalyzer:
             for line in lines:
                 stripped_line = line.strip()
                 
-                # Skip empty lines
+                # Count and skip empty lines
                 if not stripped_line:
+                    blank_lines += 1
                     continue
                 
                 # Handle multi-line comments
@@ -1566,6 +2268,21 @@ class CodeAnalyzer:
             }
 
 
+# Per-process analyzer used by the analyze_project worker pool
+_worker_analyzer = None
+
+
+def _init_worker(config):
+    """Create the analyzer once for each worker process."""
+    global _worker_analyzer
+    _worker_analyzer = CodeAnalyzer(config)
+
+
+def _analyze_file_worker(file_path: str) -> dict:
+    """Analyze one file inside a worker process."""
+    return _worker_analyzer.analyze_file(file_path)
+
+
 def analyze_file(file_path: str, content: str = None) -> dict:
     """
     Analyze a single file and return its metrics.
@@ -23,23 +23,23 @@ class CppParser:
 
     def _count_classes(self, content: str) -> int:
         """Count the number of class definitions."""
-        return len(self.class_pattern.findall(content))
+        return sum(1 for _ in self.class_pattern.finditer(content))
 
     def _count_functions(self, content: str) -> int:
         """Count the number of function definitions."""
-        return len(self.function_pattern.findall(content))
+        return sum(1 for _ in self.function_pattern.finditer(content))
 
     def _count_includes(self, content: str) -> int:
         """Count the number of include statements."""
-        return len(self.include_pattern.findall(content))
+        return sum(1 for _ in self.include_pattern.finditer(content))
 
     def _count_namespaces(self, content: str) -> int:
         """Count the number of namespace definitions."""
-        return len(self.namespace_pattern.findall(content))
+        return sum(1 for _ in self.namespace_pattern.finditer(content))
 
     def _count_templates(self, content: str) -> int:
         """Count the number of template definitions."""
-        return len(self.template_pattern.findall(content))
+        return sum(1 for _ in self.template_pattern.finditer(content))
 
     def _calculate_complexity(self, content: str) -> int:
         """Calculate cyclomatic complexity of the code."""
@@ -63,7 +63,7 @@ class CppParser:
         ]
         
         for pattern in control_structures:
-            complexity += len(re.findall(pattern, content))
+            complexity += sum(1 for _ in re.finditer(pattern, content))
         
         return complexity
 
@@ -31,39 +31,39 @@ class CSharpParser:
 
     def _count_classes(self, content: str) -> int:
         """Count the number of class definitions."""
-        return len(self.class_pattern.findall(content))
+        return sum(1 for _ in self.class_pattern.finditer(content))
 
     def _count_interfaces(self, content: str) -> int:
         """Count the number of interface definitions."""
-        return len(self.interface_pattern.findall(content))
+        return sum(1 for _ in self.interface_pattern.finditer(content))
 
     def _count_structs(self, content: str) -> int:
         """Count the number of struct definitions."""
-        return len(self.struct_pattern.findall(content))
+        return sum(1 for _ in self.struct_pattern.finditer(content))
 
     def _count_enums(self, content: str) -> int:
         """Count the number of enum definitions."""
-        return len(self.enum_pattern.findall(content))
+        return sum(1 for _ in self.enum_pattern.finditer(content))
 
     def _count_methods(self, content: str) -> int:
         """Count the number of method definitions."""
-        return len(self.method_pattern.findall(content))
+        return sum(1 for _ in self.method_pattern.finditer(content))
 
     def _count_properties(self, content: str) -> int:
         """Count the number of property definitions."""
-        return len(self.property_pattern.findall(content))
+        return sum(1 for _ in self.property_pattern.finditer(content))
 
     def _count_using_statements(self, content: str) -> int:
         """Count the number of using statements."""
-        return len(self.using_pattern.findall(content))
+        return sum(1 for _ in self.using_pattern.finditer(content))
 
     def _count_namespaces(self, content: str) -> int:
         """Count the number of namespace definitions."""
-        return len(self.namespace_pattern.findall(content))
+        return sum(1 for _ in self.namespace_pattern.finditer(content))
 
     def _count_attributes(self, content: str) -> int:
         """Count the number of attribute definitions."""
-        return len(self.attribute_pattern.findall(content))
+        return sum(1 for _ in self.attribute_pattern.finditer(content))
 
     def _calculate_complexity(self, content: str) -> int:
         """Calculate cyclomatic complexity of the code."""
@@ -90,7 +90,7 @@ class CSharpParser:
         ]
         
         for pattern in control_structures:
-            complexity += len(re.findall(pattern, content))
+            complexity += sum(1 for _ in re.finditer(pattern, content))
         
         return complexity
 
@@ -1,4 +1,7 @@
+import os
+
 import pytest
+import code_analyzer
 from code_analyzer import CodeAnalyzer
 
 def test_code_analyzer_initialization():
@@ -39,4 +42,189 @@ def test_empty_code():
     analyzer = CodeAnalyzer({})
     result = analyzer.analyze_code('')
     assert isinstance(result, dict)
-    assert result['raw_metrics']['loc'] == 0 
\ No newline at end of file
+    assert result['raw_metrics']['loc'] == 0 
+
+JAVA_SOURCE = '''
+package demo;
+
+import java.util.List;
+
+public class Demo {
+    public int count(List<Integer> values) {
+        int total = 0;
+        for (int value : values) {
+            if (value > 0) {
+                total += value;
+            }
+        }
+        return total;
+    }
+}
+'''
+
+
+def test_java_parse_cache_is_versioned(tmp_path):
+    analyzer = CodeAnalyzer({'cache_dir': str(tmp_path)})
+    summary = analyzer._java_parse_summary(JAVA_SOURCE)
+    cache_files = list(tmp_path.glob('*.pkl'))
+    assert len(cache_files) == 1
+    assert f"-v{code_analyzer.JAVA_CACHE_VERSION}-" in cache_files[0].name
+    assert analyzer._java_parse_summary(JAVA_SOURCE) == summary
+
+
+def test_java_parse_cache_ignores_corrupt_entries(tmp_path):
+    analyzer = CodeAnalyzer({'cache_dir': str(tmp_path)})
+    summary = analyzer._java_parse_summary(JAVA_SOURCE)
+    cache_file, = tmp_path.glob('*.pkl')
+    # Unpickling this raises AttributeError rather than UnpicklingError
+    cache_file.write_bytes(b'cbuiltins\nno_such_name\n.')
+    assert analyzer._java_parse_summary(JAVA_SOURCE) == summary
+    assert analyzer._analyze_java(JAVA_SOURCE)['imports'] == ['java.util.List']
+
+
+def test_analyze_file_cache_returns_copies(tmp_path):
+    source = tmp_path / 'sample.py'
+    source.write_text('def f(x):\n    return x\n')
+    analyzer = CodeAnalyzer({})
+    first = analyzer.analyze_file(str(source))
+    first['direct_deps'] = ['changed']
+    first['raw_metrics']['loc'] = -1
+    second = analyzer.analyze_file(str(source))
+    assert 'direct_deps' not in second
+    assert second['raw_metrics']['loc'] == 2
+    assert analyzer.analyze_files([str(source)]) == [second]
+
+
+@pytest.mark.parametrize('source, expected', [
+    # Blank lines inside a block comment count as comment lines
+    ('/*\n\n  text\n\n*/\nint x;\n', (0, 0, 5, 0, 1)),
+    # A Javadoc comment opened and closed on one line
+    ('/** Doc. */\nint x;\n', (0, 0, 0, 1, 1)),
+    ('/**\n * Doc\n *\n */\nvoid f() {}\n', (0, 0, 0, 4, 1)),
+    # "/**/" is an empty block comment, not Javadoc
+    ('/**/\nint z;\n', (0, 0, 1, 0, 1)),
+    # A line starting with a block comment is a comment line
+    ('/* c */ int y;\n', (0, 0, 1, 0, 0)),
+    ('  // hi\nint a; // trailing\n\n', (1, 1, 0, 0, 1)),
+    # An unterminated block comment runs to the end of the file
+    ('/* open\nint x;\n', (0, 0, 2, 0, 0)),
+    # A stray "*" continuation line outside a block comment
+    (' * stray\nint b;\n', (0, 0, 1, 0, 1)),
+])
+def test_scan_java_lines(source, expected):
+    code_lines = []
+    stats = code_analyzer._scan_java_lines(source, code_lines)
+    assert (stats.blank, stats.single, stats.multi, stats.javadoc,
+            stats.code) == expected
+    assert len(code_lines) == stats.code
+
+
+BROKEN_JAVA_SOURCE = '''/**
+ * Example.
+ */
+import java.util.List;
+
+public class Broken {
+    /* block
+
+       comment */
+    public void run() {
+        // note
+        if (ready) { go(); }
+    }
+'''
+
+
+def test_basic_java_analysis_line_counts():
+    metrics = CodeAnalyzer({})._basic_java_analysis(BROKEN_JAVA_SOURCE)
+    assert metrics['blank_lines'] == 1
+    assert metrics['single_comments'] == 1
+    assert metrics['multi_comments'] == 6
+    assert metrics['classes'] == 1
+    assert metrics['methods'] == 1
+    assert metrics['import_paths'] == ['java.util.List']
+    assert metrics['complexity'] == 2
+
+
+def test_calculate_basic_metrics_line_counts():
+    raw = CodeAnalyzer({})._calculate_basic_metrics(
+        BROKEN_JAVA_SOURCE)['raw_metrics']
+    assert (raw['loc'], raw['sloc'], raw['blank']) == (13, 12, 1)
+    assert (raw['comments'], raw['multi'], raw['javadoc']) == (1, 3, 3)
+    assert (raw['methods'], raw['imports']) == (1, 1)
+
+
+def test_java_complexity_and_nesting(tmp_path):
+    javalang = pytest.importorskip('javalang')
+    analyzer = CodeAnalyzer({'cache_dir': str(tmp_path)})
+
+    result = analyzer._analyze_java(JAVA_SOURCE)
+    # 1 + for + if + "value > 0" (0.5) + one nested block (0.5)
+    # + one parameter (0.2), truncated
+    assert result['complexity']['score'] == 4
+    assert result['maintainability']['score'] == 92
+
+    # Nesting follows branch statements that are direct children of each
+    # other; the braces of the for loop end the chain
+    buckets = analyzer._collect_java_nodes(javalang.parse.parse(JAVA_SOURCE))
+    method, = buckets[javalang.tree.MethodDeclaration]
+    assert analyzer._calculate_java_nesting_level(method) == 1
+    analyzer._nesting_cache.clear()
+
+    nested = javalang.parse.parse(
+        'class A { void f(boolean a, boolean b) {'
+        ' while (a) if (b) for (;;) a = b; } }')
+    buckets = analyzer._collect_java_nodes(nested)
+    method, = buckets[javalang.tree.MethodDeclaration]
+    assert analyzer._calculate_java_nesting_level(method) == 3
+    assert analyzer._calculate_java_nesting_level(method, level=2) == 5
+
+
+def test_analyze_files_falls_back_when_pool_breaks(tmp_path, monkeypatch):
+    from concurrent.futures.process import BrokenProcessPool
+
+    class BrokenExecutor:
+        def __init__(self, *args, **kwargs):
+            raise BrokenProcessPool('worker died')
+
+    monkeypatch.setattr(code_analyzer, 'ProcessPoolExecutor', BrokenExecutor)
+    monkeypatch.setattr(code_analyzer.os, 'cpu_count', lambda: 4)
+    paths = []
+    for index in range(code_analyzer.PARALLEL_MIN_FILES):
+        path = tmp_path / f'module{index}.py'
+        path.write_text(f'VALUE = {index}\n')
+        paths.append(str(path))
+
+    results = CodeAnalyzer({}).analyze_files(paths)
+    assert [result['file_path'] for result in results] == paths
+    assert all('error' not in result for result in results)
+
+
+def test_java_parse_cache_pruning_tolerates_concurrent_removal(
+        tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(code_analyzer, 'JAVA_CACHE_MAX_ENTRIES', 1)
+    analyzer = CodeAnalyzer({'cache_dir': str(tmp_path)})
+    analyzer._java_parse_summary('class A {}')
+
+    # Another worker removes every entry between the scan and the unlink
+    real_unlink = os.unlink
+
+    def unlink_removed(path):
+        real_unlink(path)
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(code_analyzer.os, 'unlink', unlink_removed)
+    analyzer._java_parse_summary('class B {}')
+    assert 'Could not' not in capsys.readouterr().out
+    assert len(list(tmp_path.glob('*.pkl'))) == 1
+
+
+def test_java_switch_does_not_open_a_nesting_level(tmp_path):
+    javalang = pytest.importorskip('javalang')
+    analyzer = CodeAnalyzer({'cache_dir': str(tmp_path)})
+    tree = javalang.parse.parse(
+        'class A { void f(int a) {'
+        ' if (a > 0) switch (a) { case 1: if (a == 1) a = 2; } } }')
+    method, = analyzer._collect_java_nodes(tree)[
+        javalang.tree.MethodDeclaration]
+    assert analyzer._calculate_java_nesting_level(method) == 1